@@ -1,52 +1,82 @@
 """Configuration settings loader."""
 
 import os
+from functools import cached_property
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
+# Environment variables are loaded from this .env file on first settings access
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
+_env_loaded = False
+
+
+def _load_env_once() -> None:
+    """Load the .env file the first time a setting is read."""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv(env_path)
+        _env_loaded = True
+
+
+def _getenv(name: str, default: str) -> str:
+    """Read an environment variable, loading .env first if needed."""
+    _load_env_once()
+    return os.getenv(name, default)
 
 
 class Settings:
-    """Application settings loaded from environment variables."""
-    
+    """Application settings loaded from environment variables.
+
+    Values are parsed lazily on first access and then cached on the instance.
+    """
+
     # Telegram Bot
-    TELEGRAM_BOT_TOKEN: str = os.getenv('TELEGRAM_BOT_TOKEN', '')
-    
-    # Security - Allowed user IDs (comma-separated string to set of ints)
-    _allowed_ids = os.getenv('ALLOWED_USER_IDS', '')
-    ALLOWED_USER_IDS: set[int] = {
-        int(uid.strip()) 
-        for uid in _allowed_ids.split(',') 
-        if uid.strip().isdigit()
-    }
-    
+    @cached_property
+    def TELEGRAM_BOT_TOKEN(self) -> str:
+        return _getenv('TELEGRAM_BOT_TOKEN', '')
+
+    # Security - Allowed user IDs (comma-separated string to frozenset of ints)
+    @cached_property
+    def ALLOWED_USER_IDS(self) -> frozenset[int]:
+        return frozenset(
+            int(uid.strip())
+            for uid in _getenv('ALLOWED_USER_IDS', '').split(',')
+            if uid.strip().isdigit()
+        )
+
     # Gemini CLI
-    GEMINI_CLI_COMMAND: str = os.getenv('GEMINI_CLI_COMMAND', 'npx @google/gemini-cli')
-    GEMINI_TIMEOUT: int = int(os.getenv('GEMINI_TIMEOUT', '300'))
-    
+    @cached_property
+    def GEMINI_CLI_COMMAND(self) -> str:
+        return _getenv('GEMINI_CLI_COMMAND', 'npx @google/gemini-cli')
+
+    @cached_property
+    def GEMINI_TIMEOUT(self) -> int:
+        return int(_getenv('GEMINI_TIMEOUT', '300'))
+
     # Groq API (for Whisper voice transcription)
-    GROQ_API_KEY: str = os.getenv('GROQ_API_KEY', '')
-    
+    @cached_property
+    def GROQ_API_KEY(self) -> str:
+        return _getenv('GROQ_API_KEY', '')
+
     # Paths
-    DATA_DIR: Path = Path(os.getenv('DATA_DIR', 'D:/Gemini CLI'))
+    @cached_property
+    def DATA_DIR(self) -> Path:
+        return Path(_getenv('DATA_DIR', 'D:/Gemini CLI'))
+
     PROJECT_ROOT: Path = Path(__file__).parent.parent
     CONFIG_DIR: Path = PROJECT_ROOT / 'config'
     GEMINI_SETTINGS_PATH: Path = CONFIG_DIR / 'gemini_settings.json'
-    
-    @classmethod
-    def validate(cls) -> list[str]:
+
+    def validate(self) -> list[str]:
         """Validate required settings. Returns list of errors."""
         errors = []
-        
-        if not cls.TELEGRAM_BOT_TOKEN:
+
+        if not self.TELEGRAM_BOT_TOKEN:
             errors.append("TELEGRAM_BOT_TOKEN is not set in .env")
-        
-        if not cls.ALLOWED_USER_IDS:
+
+        if not self.ALLOWED_USER_IDS:
             errors.append("ALLOWED_USER_IDS is not set in .env")
-        
+
         return errors
 
 
@@ -1,37 +1,64 @@
-import json
+import heapq
+import os
+import sys
+from operator import itemgetter
 from pathlib import Path
 
+# Add project root to path for imports
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.utils import json_io
+
 NEWS_DATA_DIR = Path("D:/Gemini CLI/News")
-SEEN_ARTICLES_FILE = NEWS_DATA_DIR / "seen_articles.json"
+SEEN_ARTICLES_FILE = NEWS_DATA_DIR / "seen_articles.ndjson"
+
+
+def _iter_seen(path: Path):
+    """Stream (link, timestamp) pairs from the NDJSON log without loading the file."""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                entry = json_io.loads(line)
+                yield entry['link'], entry['ts']
+
 
 def main(n: int = 31):
     if not SEEN_ARTICLES_FILE.exists():
         print("Seen articles file not found.")
         return
 
-    with open(SEEN_ARTICLES_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Pass 1: find the N most recent entries (O(n) memory, no full sort)
+    total = 0
 
-    seen = data.get('seen', {})
-    print(f"Total seen articles before: {len(seen)}")
+    def counted(items):
+        nonlocal total
+        for item in items:
+            total += 1
+            yield item
 
-    # Sort by timestamp descending, remove the N most recent
-    sorted_items = sorted(seen.items(), key=lambda x: x[1], reverse=True)
-    
-    to_remove = sorted_items[:n]
-    to_keep = sorted_items[n:]
+    to_remove = heapq.nlargest(n, counted(_iter_seen(SEEN_ARTICLES_FILE)), key=itemgetter(1))
+    remove_links = {link for link, _ in to_remove}
+    print(f"Total seen articles before: {total}")
 
     print(f"\nRemoving {len(to_remove)} most recent articles:")
     for link, ts in to_remove:
         print(f"  - {ts}: {link[:80]}")
 
-    data['seen'] = dict(to_keep)
-
-    with open(SEEN_ARTICLES_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # Pass 2: stream the kept entries into a temp file, then swap it in atomically
+    tmp_file = SEEN_ARTICLES_FILE.with_suffix('.tmp')
+    kept = 0
+    with open(tmp_file, 'wb') as out:
+        for link, ts in _iter_seen(SEEN_ARTICLES_FILE):
+            if link in remove_links:
+                continue
+            out.write(json_io.dumps({'link': link, 'ts': ts}) + b'\n')
+            kept += 1
+    os.replace(tmp_file, SEEN_ARTICLES_FILE)
 
     print(f"\nRemoved: {len(to_remove)}")
-    print(f"Remaining: {len(to_keep)}")
+    print(f"Remaining: {kept}")
 
 if __name__ == "__main__":
     main()
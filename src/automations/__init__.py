@@ -4,32 +4,95 @@ This module provides functionality to dynamically load and manage
 automation plugins based on configuration.
 """
 
+import asyncio
 import importlib
-import json
-from pathlib import Path
-from typing import Dict, List, Any, Optional
-
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple
 
+from src.utils import json_io
 from src.utils.logger import logger
 
+# Resolved automation classes, keyed by automation name
+_automation_class_cache: Dict[str, type] = {}
+
+# Automation names whose module failed to import (not retried on reload)
+_failed_imports: Set[str] = set()
+
+# (mtime_ns, parsed config) of the last automations.json read
+_config_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+
+def _cached_import(module_name: str, item_name: str) -> Any:
+    """Import a module attribute, reusing the module from sys.modules if loaded.
+    
+    Args:
+        module_name: Dotted module path
+        item_name: Attribute to fetch from the module
+        
+    Returns:
+        The requested attribute
+        
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such attribute
+    """
+    modules = sys.modules
+    if module_name not in modules:
+        importlib.import_module(module_name)
+    return getattr(modules[module_name], item_name)
+
+
+def _validate_automation_config(data: Any) -> Dict[str, Dict[str, Any]]:
+    """Check the automations.json schema: {name: {"enabled": bool, ...}}.
+    
+    Args:
+        data: Parsed JSON document
+        
+    Returns:
+        The same data, known to match the schema
+        
+    Raises:
+        ValueError: If any part of the config has the wrong shape
+    """
+    if not isinstance(data, dict):
+        raise ValueError("automation config must be a JSON object")
+    
+    for name, settings in data.items():
+        if not isinstance(settings, dict):
+            raise ValueError(f"automation '{name}' config must be an object")
+        if not isinstance(settings.get('enabled', False), bool):
+            raise ValueError(f"automation '{name}' 'enabled' must be true or false")
+    
+    return data
+
 
 def load_automation_config() -> Dict[str, Any]:
-    """Load automation configuration from JSON file.
+    """Load and validate automation configuration from JSON file.
+    
+    The parsed config is cached and only re-read when the file's
+    modification time changes.
     
     Returns:
         Dictionary of automation configurations
     """
+    global _config_cache
+    
     config_path = Path(__file__).parent.parent.parent / 'config' / 'automations.json'
     
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         logger.warning(f"Automation config not found at {config_path}, using defaults")
         return {}
     
+    if _config_cache and _config_cache[0] == st.st_mtime_ns:
+        return _config_cache[1]
+    
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        data = _validate_automation_config(json_io.loads(config_path.read_bytes()))
+        _config_cache = (st.st_mtime_ns, data)
+        return data
     except Exception as e:
         logger.error(f"Failed to load automation config: {e}")
         return {}
@@ -40,7 +103,8 @@ def load_automations(application, config: Optional[Dict[str, Any]] = None) -> Li
     
     Args:
         application: Telegram application instance
-        config: Optional config dict. If None, loads from file.
+        config: Optional config dict matching the automations.json schema.
+            If None, loads (and validates) it from file.
         
     Returns:
         List of loaded automation instances
@@ -51,24 +115,27 @@ def load_automations(application, config: Optional[Dict[str, Any]] = None) -> Li
     loaded_automations = []
     
     for name, settings in config.items():
-        if not isinstance(settings, dict):
-            continue
-            
         if not settings.get('enabled', False):
             logger.info(f"Automation '{name}' is disabled, skipping")
             continue
         
+        if name in _failed_imports:
+            logger.debug(f"Automation '{name}' failed to import previously, skipping")
+            continue
+        
         try:
-            # Import the automation module
-            module = importlib.import_module(f'src.automations.{name}')
-            
-            # Get the automation class
-            if not hasattr(module, 'automation_class'):
-                logger.error(f"Automation '{name}' has no 'automation_class' export")
-                continue
+            # Resolve the automation class (cached after first load)
+            automation_class = _automation_class_cache.get(name)
+            if automation_class is None:
+                try:
+                    automation_class = _cached_import(f'src.automations.{name}', 'automation_class')
+                except AttributeError:
+                    logger.error(f"Automation '{name}' has no 'automation_class' export")
+                    continue
+                _automation_class_cache[name] = automation_class
             
             # Instantiate the automation
-            automation = module.automation_class(application, settings)
+            automation = automation_class(application, settings)
             
             # Register handlers
             automation.register_handlers()
@@ -77,6 +144,7 @@ def load_automations(application, config: Optional[Dict[str, Any]] = None) -> Li
             logger.info(f"Loaded automation: {automation.name}")
             
         except ImportError as e:
+            _failed_imports.add(name)
             logger.error(f"Failed to import automation '{name}': {e}")
         except Exception as e:
             logger.error(f"Failed to load automation '{name}': {e}")
@@ -85,28 +153,34 @@ def load_automations(application, config: Optional[Dict[str, Any]] = None) -> Li
 
 
 async def start_automations(automations: List[Any]) -> None:
-    """Start all loaded automations.
+    """Start all loaded automations concurrently.
     
     Args:
         automations: List of automation instances
     """
-    for automation in automations:
-        try:
-            await automation.start()
+    results = await asyncio.gather(
+        *(automation.start() for automation in automations),
+        return_exceptions=True
+    )
+    for automation, result in zip(automations, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to start automation '{automation.name}': {result}")
+        else:
             logger.info(f"Started automation: {automation.name}")
-        except Exception as e:
-            logger.error(f"Failed to start automation '{automation.name}': {e}")
 
 
 async def stop_automations(automations: List[Any]) -> None:
-    """Stop all loaded automations.
+    """Stop all loaded automations concurrently.
     
     Args:
         automations: List of automation instances
     """
-    for automation in automations:
-        try:
-            await automation.stop()
+    results = await asyncio.gather(
+        *(automation.stop() for automation in automations),
+        return_exceptions=True
+    )
+    for automation, result in zip(automations, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to stop automation '{automation.name}': {result}")
+        else:
             logger.info(f"Stopped automation: {automation.name}")
-        except Exception as e:
-            logger.error(f"Failed to stop automation '{automation.name}': {e}")
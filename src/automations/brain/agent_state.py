@@ -268,11 +268,15 @@ class AgentState:
                 self._save()
                 logger.info(f"Agent: Bumped next cycle to {self.next_cycle_at.strftime('%H:%M')}")
     
-    def is_cycle_due(self) -> bool:
-        """Check if it's time for a cycle."""
+    def is_cycle_due(self, now: Optional[datetime] = None) -> bool:
+        """Check if it's time for a cycle.
+        
+        Args:
+            now: Current time, if the caller already has it
+        """
         if self.next_cycle_at is None:
             return True
-        return datetime.now() >= self.next_cycle_at
+        return (now or datetime.now()) >= self.next_cycle_at
     
     def mark_cycle_complete(self) -> None:
         """Record that a cycle just ran."""
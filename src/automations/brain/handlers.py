@@ -5,13 +5,10 @@ that maintains a persistent task queue, works across cycles, and reacts to event
 """
 
 import asyncio
-import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
 from telegram import Update
 from telegram.ext import Application, MessageHandler, filters, ContextTypes
 
@@ -21,11 +18,19 @@ from src.automations.brain.learnings import AgentLearnings
 from src.automations.brain.scheduler import AgentScheduler
 from src.automations.brain.thinker import AgentThinker
 from src.automations.brain.persona_enricher import PersonaEnricher
+from src.gemini.cli_wrapper import GeminiCLI
 from src.utils.conversation import conversation_history
 from src.utils.logger import logger
 from config.settings import settings
 
 
+class _ExactUpdate(filters.MessageFilter):
+    """Matches messages whose text is exactly 'update' (no regex search)."""
+    
+    def filter(self, message) -> bool:
+        return message.text == 'update'
+
+
 class BrainAutomation(BaseAutomation):
     """Autonomous AI agent automation.
     
@@ -61,11 +66,15 @@ class BrainAutomation(BaseAutomation):
             learnings_file = str(settings.DATA_DIR / learnings_file)
         self.learnings = AgentLearnings(learnings_file=learnings_file)
         
+        # One Gemini CLI wrapper shared by the thinker and the persona enricher
+        self.gemini = GeminiCLI.get_instance()
+        
         # Initialize thinker
         self.thinker = AgentThinker(
             state=self.state,
             learnings=self.learnings,
-            conversation_file=config.get('conversation_file')
+            conversation_file=config.get('conversation_file'),
+            gemini=self.gemini
         )
         
         # Initialize scheduler
@@ -83,7 +92,7 @@ class BrainAutomation(BaseAutomation):
         self._task_manager = None
         
         # Initialize persona enricher (kept from v2)
-        self.enricher = PersonaEnricher()
+        self.enricher = PersonaEnricher(gemini=self.gemini)
         
         # Weekly persona enrichment config
         self.persona_day = config.get('persona_update_day', 6)  # 0=Mon, 6=Sun
@@ -106,10 +115,11 @@ class BrainAutomation(BaseAutomation):
     def register_handlers(self) -> None:
         """Register Telegram handlers."""
         # Handler for "update" approval message (persona)
-        update_handler = MessageHandler(
-            filters.TEXT & filters.Regex(r'^update$'),
-            self._handle_update_approval
-        )
+        # Restrict to the configured user so other senders are dropped in dispatch
+        update_filter = filters.TEXT & _ExactUpdate()
+        if self.user_id:
+            update_filter = update_filter & filters.User(user_id=self.user_id)
+        update_handler = MessageHandler(update_filter, self._handle_update_approval)
         self.application.add_handler(update_handler)
         self._handlers.append(update_handler)
         logger.info("Brain: Registered persona update approval handler")
@@ -195,7 +205,7 @@ class BrainAutomation(BaseAutomation):
         # Check if learnings need consolidation
         if self.learnings.needs_consolidation():
             logger.info("Agent: Triggering learnings consolidation...")
-            await self.learnings.consolidate(self.thinker.gemini)
+            await self.learnings.consolidate(self.gemini)
         
         return (report, is_done)
     
@@ -263,16 +273,51 @@ class BrainAutomation(BaseAutomation):
     
     # --- Persona Enrichment (unchanged from v2) ---
     
+    # Longest single sleep in the persona loop, so a suspended machine
+    # doesn't oversleep the weekly slot by much
+    _MAX_PERSONA_SLEEP = 6 * 3600
+    
+    def _next_fire(self, now: datetime) -> float:
+        """Get seconds until the next weekly persona update slot.
+        
+        Args:
+            now: Current time
+            
+        Returns:
+            Seconds to sleep (0 if the slot is due now)
+        """
+        days_ahead = (self.persona_day - now.weekday()) % 7
+        if days_ahead == 0 and now.hour >= self.persona_hour:
+            already_ran_today = (
+                self._last_persona_check_date is not None
+                and self._last_persona_check_date.date() == now.date()
+            )
+            if not already_ran_today:
+                return 0.0
+            days_ahead = 7
+        
+        target = (now + timedelta(days=days_ahead)).replace(
+            hour=self.persona_hour, minute=0, second=0, microsecond=0
+        )
+        return max(0.0, (target - now).total_seconds())
+    
     async def _persona_loop(self) -> None:
-        """Background loop for weekly persona enrichment."""
+        """Background loop for weekly persona enrichment.
+        
+        Sleeps until the next (persona_day, persona_hour) slot instead of
+        polling every hour.
+        """
         while self._running:
+            delay = min(self._next_fire(datetime.now()), self._MAX_PERSONA_SLEEP)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                break
+            
             try:
                 await self._check_persona_update()
             except Exception as e:
                 logger.error(f"Brain: Error in persona loop: {e}")
-            
-            # Check every hour
-            await asyncio.sleep(3600)
     
     async def _check_persona_update(self) -> None:
         """Check if it's time for weekly persona update."""
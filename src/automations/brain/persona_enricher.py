@@ -3,10 +3,7 @@
 Analyzes conversations and suggests updates to persona.txt.
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
+import re
 from typing import Optional, Tuple
 from src.gemini.cli_wrapper import GeminiCLI
 from src.utils.conversation import conversation_history
@@ -18,6 +15,8 @@ class PersonaEnricher:
     """Analyzes conversations and generates persona update suggestions."""
     
     PERSONA_FILE = settings.DATA_DIR / "persona.txt"
+    # Only the most recent history is needed to spot new persona details
+    MAX_CONTEXT_CHARS = 32_000
     
     ENRICHMENT_PROMPT = """You are analyzing a week of conversations to learn new things about the user.
 
@@ -47,16 +46,42 @@ If there is nothing significant to add (e.g., conversations were too brief or di
 
 Remember: Only suggest things that would genuinely help personalize future interactions. Don't pad with obvious or trivial observations."""
 
-    def __init__(self):
-        """Initialize the enricher."""
-        self.gemini = GeminiCLI.get_instance()
+    # Literal chunks around the two placeholders, split once at class load
+    _PROMPT_HEAD, _prompt_rest = ENRICHMENT_PROMPT.split('{current_persona}', 1)
+    _PROMPT_MID, _PROMPT_TAIL = _prompt_rest.split('{conversation_context}', 1)
+    del _prompt_rest
+
+    # Matches each response section header and its body, up to the next header
+    _SECTION_RE = re.compile(
+        r'(NEW LEARNINGS:|SUGGESTED ADDITIONS TO PERSONA:)\s*(.*?)'
+        r'(?=\nNEW LEARNINGS:|\nSUGGESTED ADDITIONS TO PERSONA:|\Z)',
+        re.DOTALL
+    )
+
+    def __init__(self, gemini: Optional[GeminiCLI] = None):
+        """Initialize the enricher.
+        
+        Args:
+            gemini: GeminiCLI instance to use (defaults to the shared singleton)
+        """
+        self.gemini = gemini or GeminiCLI.get_instance()
+        # (mtime_ns, content) of the last persona file read
+        self._persona_cache: Optional[Tuple[int, str]] = None
     
     def get_current_persona(self) -> str:
-        """Read the current persona file."""
+        """Read the current persona file (cached until the file changes)."""
         try:
-            if self.PERSONA_FILE.exists():
-                return self.PERSONA_FILE.read_text(encoding='utf-8')
-            return "(No persona file found)"
+            try:
+                mtime_ns = self.PERSONA_FILE.stat().st_mtime_ns
+            except FileNotFoundError:
+                return "(No persona file found)"
+            
+            if self._persona_cache and self._persona_cache[0] == mtime_ns:
+                return self._persona_cache[1]
+            
+            content = self.PERSONA_FILE.read_text(encoding='utf-8')
+            self._persona_cache = (mtime_ns, content)
+            return content
         except Exception as e:
             logger.error(f"PersonaEnricher: Error reading persona: {e}")
             return "(Error reading persona)"
@@ -69,16 +94,19 @@ Remember: Only suggest things that would genuinely help personalize future inter
         """
         try:
             current_persona = self.get_current_persona()
-            conversation_context = conversation_history.get_context_for_gemini()
+            conversation_context = conversation_history.get_context_for_gemini(
+                max_chars=self.MAX_CONTEXT_CHARS
+            ) or ''
             
-            if not conversation_context or len(conversation_context.strip()) < 200:
+            # Length check first; isspace() avoids copying the context like strip() would
+            if len(conversation_context) < 200 or conversation_context.isspace():
                 logger.info("PersonaEnricher: Not enough conversation to analyze")
                 return None, None
             
             # Build the prompt
-            prompt = self.ENRICHMENT_PROMPT.format(
-                current_persona=current_persona,
-                conversation_context=conversation_context
+            prompt = (
+                f"{self._PROMPT_HEAD}{current_persona}"
+                f"{self._PROMPT_MID}{conversation_context}{self._PROMPT_TAIL}"
             )
             
             # Ask Gemini to analyze (no MCP needed)
@@ -90,9 +118,12 @@ Remember: Only suggest things that would genuinely help personalize future inter
                 logger.info("PersonaEnricher: No significant updates to suggest")
                 return None, None
             
-            # Parse the response
-            learnings = self._extract_section(response, "NEW LEARNINGS:")
-            suggestions = self._extract_section(response, "SUGGESTED ADDITIONS TO PERSONA:")
+            # Parse both sections in a single pass
+            sections = {}
+            for match in self._SECTION_RE.finditer(response):
+                sections.setdefault(match.group(1), match.group(2).strip())
+            learnings = sections.get("NEW LEARNINGS:")
+            suggestions = sections.get("SUGGESTED ADDITIONS TO PERSONA:")
             
             if not learnings or not suggestions:
                 logger.info("PersonaEnricher: Could not parse update suggestions")
@@ -105,25 +136,6 @@ Remember: Only suggest things that would genuinely help personalize future inter
             logger.error(f"PersonaEnricher: Error analyzing: {e}")
             return None, None
     
-    def _extract_section(self, text: str, header: str) -> Optional[str]:
-        """Extract a section from the response."""
-        try:
-            if header not in text:
-                return None
-            
-            start = text.index(header) + len(header)
-            
-            # Find next section or end
-            next_headers = ["NEW LEARNINGS:", "SUGGESTED ADDITIONS"]
-            end = len(text)
-            for h in next_headers:
-                if h != header and h in text[start:]:
-                    end = min(end, start + text[start:].index(h))
-            
-            return text[start:end].strip()
-        except:
-            return None
-    
     def apply_update(self, additions: str) -> bool:
         """Append the suggested additions to persona.txt.
         
@@ -134,16 +146,14 @@ Remember: Only suggest things that would genuinely help personalize future inter
             True if successful
         """
         try:
-            current = self.get_current_persona()
-            
-            # Add a separator and the new content
-            updated = (
-                f"{current}\n\n"
-                f"## LEARNED FROM CONVERSATIONS (Auto-updated)\n"
-                f"{additions}"
-            )
+            # Append a separator and the new content (no need to rewrite the file)
+            with self.PERSONA_FILE.open('a', encoding='utf-8') as f:
+                f.write(
+                    f"\n\n"
+                    f"## LEARNED FROM CONVERSATIONS (Auto-updated)\n"
+                    f"{additions}"
+                )
             
-            self.PERSONA_FILE.write_text(updated, encoding='utf-8')
             logger.info("PersonaEnricher: Successfully updated persona.txt")
             return True
             
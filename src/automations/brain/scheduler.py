@@ -6,14 +6,10 @@ Replaces the fixed-interval scheduler with adaptive timing:
 - Event-triggered → can be bumped to fire sooner
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Callable, Optional, Awaitable, Tuple
 import asyncio
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
 from src.automations.brain.agent_state import AgentState
 from src.utils.logger import logger
 
@@ -53,21 +49,36 @@ class AgentScheduler:
         self.max_cycle_minutes = max_cycle_minutes
         self.quiet_hours_start = quiet_hours_start
         self.quiet_hours_end = quiet_hours_end
+        # Quiet hours as minute-of-day integers (avoids float compares per check)
+        self._quiet_start_min = int(round(quiet_hours_start * 60))
+        self._quiet_end_min = int(round(quiet_hours_end * 60))
         self.on_cycle = on_cycle
         self.on_message = on_message
         
         self._running = False
         self._task: Optional[asyncio.Task] = None
     
-    def _is_quiet_hours(self) -> bool:
-        """Check if current time is within quiet hours."""
-        now = datetime.now()
-        current_hour = now.hour + now.minute / 60
+    def _is_quiet_hours(self, now: Optional[datetime] = None) -> bool:
+        """Check if the given (or current) time is within quiet hours."""
+        if now is None:
+            now = datetime.now()
+        minute_of_day = now.hour * 60 + now.minute
+        start, end = self._quiet_start_min, self._quiet_end_min
         
-        if self.quiet_hours_start > self.quiet_hours_end:
-            return current_hour >= self.quiet_hours_start or current_hour < self.quiet_hours_end
+        if start > end:
+            return minute_of_day >= start or minute_of_day < end
         else:
-            return self.quiet_hours_start <= current_hour < self.quiet_hours_end
+            return start <= minute_of_day < end
+    
+    def _minutes_until_quiet_end(self, now: Optional[datetime] = None) -> int:
+        """Get whole minutes from now until quiet hours end."""
+        if now is None:
+            now = datetime.now()
+        end_hour, end_minute = divmod(self._quiet_end_min, 60)
+        end = now.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
+        if end <= now:
+            end += timedelta(days=1)
+        return int((end - now).total_seconds() // 60) + 1
     
     async def start(self) -> None:
         """Start the agent scheduler."""
@@ -111,13 +122,16 @@ class AgentScheduler:
                 # Check every 60 seconds if it's time
                 await asyncio.sleep(60)
                 
-                if not self.state.is_cycle_due():
+                # One clock read per tick, shared by all checks below
+                now = datetime.now()
+                
+                if not self.state.is_cycle_due(now):
                     continue
                 
-                if self._is_quiet_hours():
+                if self._is_quiet_hours(now):
                     logger.debug("Agent: Skipping cycle — quiet hours")
-                    # Schedule next check for after quiet hours
-                    self.state.set_next_cycle(self.max_cycle_minutes)
+                    # Schedule next cycle right after quiet hours end (one step)
+                    self.state.set_next_cycle(max(1, self._minutes_until_quiet_end(now)))
                     continue
                 
                 await self._execute_cycle()
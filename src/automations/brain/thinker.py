@@ -25,6 +25,19 @@ NO_ACTION_MARKER = "[NO_ACTION]"
 SILENT_MARKER = "[SILENT]"
 
 
+def _stripped_len(text: str) -> int:
+    """Return len(text.strip()) without copying the string.
+    
+    Only the leading and trailing whitespace is scanned.
+    """
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end - start
+
+
 class AgentThinker:
     """Two-phase autonomous thinker: triage then work."""
     
@@ -111,17 +124,32 @@ Only include "lesson" if you genuinely discovered something reusable — don't f
 {context}
 === END HISTORY ==="""
 
-    def __init__(self, state: AgentState, learnings: AgentLearnings = None, conversation_file: Optional[str] = None):
+    # Each prompt is split at {context} once at class load: the small head is
+    # formatted per call and the (large) context is joined in unformatted.
+    # The tails hold no placeholders, so format() just unescapes their braces.
+    _TRIAGE_HEAD, _TRIAGE_TAIL = TRIAGE_PROMPT.split('{context}', 1)
+    _TRIAGE_TAIL = _TRIAGE_TAIL.format()
+    _WORK_HEAD, _WORK_TAIL = WORK_PROMPT.split('{context}', 1)
+    _WORK_TAIL = _WORK_TAIL.format()
+
+    def __init__(
+        self,
+        state: AgentState,
+        learnings: AgentLearnings = None,
+        conversation_file: Optional[str] = None,
+        gemini: Optional[GeminiCLI] = None
+    ):
         """Initialize the thinker.
         
         Args:
             state: The agent's persistent state
             learnings: The agent's persistent learnings store
             conversation_file: Path to conversation history file
+            gemini: GeminiCLI instance to use (defaults to the shared singleton)
         """
         self.state = state
         self.learnings = learnings or AgentLearnings()
-        self.gemini = GeminiCLI.get_instance()
+        self.gemini = gemini or GeminiCLI.get_instance()
         self.conversation_file = conversation_file
     
     async def run_triage(self, user_tasks_context: str = "") -> Optional[str]:
@@ -136,7 +164,7 @@ Only include "lesson" if you genuinely discovered something reusable — don't f
         try:
             context = conversation_history.get_context_for_gemini()
             
-            if not context or len(context.strip()) < 50:
+            if not context or _stripped_len(context) < 50:
                 logger.debug("Agent: Not enough conversation history for triage")
                 return None
             
@@ -162,14 +190,17 @@ Only include "lesson" if you genuinely discovered something reusable — don't f
             if learnings_section:
                 learnings_section += "\n"
             
-            prompt = self.TRIAGE_PROMPT.format(
-                persona_section=persona_section,
-                capabilities_section=capabilities_section,
-                learnings_section=learnings_section,
-                state_summary=self.state.get_state_summary(),
-                user_tasks_section=user_tasks_section,
-                context=context
-            )
+            prompt = ''.join((
+                self._TRIAGE_HEAD.format(
+                    persona_section=persona_section,
+                    capabilities_section=capabilities_section,
+                    learnings_section=learnings_section,
+                    state_summary=self.state.get_state_summary(),
+                    user_tasks_section=user_tasks_section
+                ),
+                context,
+                self._TRIAGE_TAIL
+            ))
             
             logger.info("Agent: Running triage...")
             response = await self.gemini.send_message(prompt, use_mcp=False)
@@ -299,14 +330,17 @@ Only include "lesson" if you genuinely discovered something reusable — don't f
             if learnings_section:
                 learnings_section += "\n"
             
-            prompt = self.WORK_PROMPT.format(
-                persona_section=persona_section,
-                capabilities_section=capabilities_section,
-                learnings_section=learnings_section,
-                task_description=task.task,
-                task_notes=task_notes,
-                context=context
-            )
+            prompt = ''.join((
+                self._WORK_HEAD.format(
+                    persona_section=persona_section,
+                    capabilities_section=capabilities_section,
+                    learnings_section=learnings_section,
+                    task_description=task.task,
+                    task_notes=task_notes
+                ),
+                context,
+                self._WORK_TAIL
+            ))
             
             logger.info(f"Agent: Working on task '{task.task[:50]}' (cycle {task.progress + 1})")
             response = await self.gemini.send_message(prompt, use_mcp=True)
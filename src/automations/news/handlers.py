@@ -1,8 +1,9 @@
 """Telegram handlers for news automation."""
 
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Optional
 
-from telegram import Update
+from telegram import Message, Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 
 import sys
@@ -11,10 +12,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from src.automations.base import BaseAutomation
 from src.automations.news.scheduler import NewsScheduler
-from src.automations.news.scraper import NewsArticle
+from src.automations.news.scraper import NewsArticle, close_client
 from src.automations.news.summarizer import summarize_articles
 from src.bot.security import authorized_only
+from src.gemini.cli_wrapper import GeminiCLI
 from src.utils.logger import logger
+from src.utils.markdown import markdown_to_html
 from config.settings import settings
 
 
@@ -25,12 +28,18 @@ class NewsAutomation(BaseAutomation):
     description = "Daily gaming news digest with AI summarization"
     version = "1.0.0"
     
+    # Maximum number of users sent to concurrently
+    MAX_CONCURRENT_SENDS = 10
+    
     def __init__(self, application: Application, config: Dict[str, Any]):
         super().__init__(application, config)
         
         # Store bot reference for sending messages
         self._bot = None
         
+        # Shared Gemini CLI wrapper, resolved once for all digests
+        self.gemini = GeminiCLI.get_instance()
+        
         # Initialize scheduler
         self.scheduler = NewsScheduler(
             send_message=self._send_message,
@@ -63,6 +72,7 @@ class NewsAutomation(BaseAutomation):
     async def stop(self) -> None:
         """Stop the news scheduler."""
         await self.scheduler.stop()
+        await close_client()
         await super().stop()
     
     async def _send_message(self, message: str) -> None:
@@ -76,8 +86,7 @@ class NewsAutomation(BaseAutomation):
             return
         
         # Convert Markdown to HTML for reliable link rendering
-        from src.bot.handlers import _markdown_to_html
-        html_message = _markdown_to_html(message)
+        html_message = markdown_to_html(message)
         
         # Split into chunks if too long (Telegram limit: 4096 chars)
         max_length = 4000  # Safety margin
@@ -98,7 +107,22 @@ class NewsAutomation(BaseAutomation):
                 chunks.append(remaining[:split_point])
                 remaining = remaining[split_point:].lstrip()
         
-        for user_id in settings.ALLOWED_USER_IDS:
+        # Send to all users concurrently; each user's chunks stay in order
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+        await asyncio.gather(
+            *(self._send_to_user(user_id, chunks, semaphore) for user_id in settings.ALLOWED_USER_IDS),
+            return_exceptions=True
+        )
+    
+    async def _send_to_user(self, user_id: int, chunks: List[str], semaphore: asyncio.Semaphore) -> None:
+        """Send message chunks to one user, logging any failure.
+        
+        Args:
+            user_id: Telegram chat ID to send to
+            chunks: HTML message chunks, sent in order
+            semaphore: Limits how many users are sent to at once
+        """
+        async with semaphore:
             try:
                 for chunk in chunks:
                     await self._bot.send_message(
@@ -112,8 +136,81 @@ class NewsAutomation(BaseAutomation):
                 logger.error(f"News: Failed to send to {user_id}: {e}")
     
     async def _summarize_articles(self, articles: List[NewsArticle]) -> str:
-        """Summarize articles using Gemini."""
-        return await summarize_articles(articles)
+        """Summarize articles using Gemini.
+        
+        Once the summary starts streaming, each user sees a preview message
+        that is edited as sections complete. Previews are sent and edited in
+        the background so Telegram latency doesn't hold up the stream, and are
+        deleted once the summary is ready, just before the full digest is sent.
+        A cached summary returns without any preview.
+        """
+        if not self._bot:
+            return await summarize_articles(articles, gemini=self.gemini)
+        
+        previews: Optional[List[Message]] = None
+        preview_task: Optional[asyncio.Task] = None
+        
+        async def show_preview(html: str) -> None:
+            nonlocal previews
+            if previews is None:
+                # First section: send a preview to every user
+                user_ids = list(settings.ALLOWED_USER_IDS)
+                results = await asyncio.gather(
+                    *(self._bot.send_message(
+                        chat_id=user_id,
+                        text=html,
+                        parse_mode='HTML',
+                        disable_web_page_preview=True,
+                    ) for user_id in user_ids),
+                    return_exceptions=True
+                )
+                previews = []
+                for user_id, result in zip(user_ids, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"News: Could not send preview to {user_id}: {result}")
+                    else:
+                        previews.append(result)
+                return
+            
+            results = await asyncio.gather(
+                *(preview.edit_text(html, parse_mode='HTML', disable_web_page_preview=True)
+                  for preview in previews),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.debug(f"News: Could not update preview: {result}")
+        
+        async def update_previews(partial: str) -> None:
+            nonlocal preview_task
+            if preview_task and not preview_task.done():
+                return  # Still sending the last update; skip this one
+            html = markdown_to_html(f"📰 **Digest preview**\n\n{partial}")
+            if len(html) > 4000:
+                return  # Too long for one message; the full digest follows
+            preview_task = asyncio.create_task(show_preview(html))
+        
+        try:
+            return await summarize_articles(
+                articles,
+                gemini=self.gemini,
+                on_progress=update_previews
+            )
+        finally:
+            # Let an in-flight send finish so none of its previews are left behind
+            if preview_task:
+                try:
+                    await preview_task
+                except Exception as e:
+                    logger.debug(f"News: Preview update failed: {e}")
+            if previews:
+                results = await asyncio.gather(
+                    *(preview.delete() for preview in previews),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.debug(f"News: Could not delete preview: {result}")
     
     @authorized_only
     async def _news_command(
@@ -4,10 +4,11 @@ Sends a daily digest of gaming industry news with Gemini summarization.
 """
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Callable, Optional, Awaitable, List
 from pathlib import Path
 
+from src.utils import json_io
 from src.utils.logger import logger
 from src.automations.news.scraper import NewsScraper, NewsArticle, NEWS_DATA_DIR
 
@@ -18,6 +19,10 @@ NEWS_STATE_FILE = NEWS_DATA_DIR / "news_scheduler_state.json"
 class NewsScheduler:
     """Scheduler for daily news digests."""
     
+    # Longest single sleep, so the loop re-syncs with the wall clock
+    # (e.g. after the laptop wakes from suspend)
+    _MAX_SLEEP = 3600
+    
     def __init__(
         self,
         send_message: Callable[[str], Awaitable[None]],
@@ -35,7 +40,7 @@ class NewsScheduler:
             summarize_with_gemini: Callback to summarize articles with Gemini
             digest_hour: Hour to send daily digest (0-23)
             digest_minute: Minute to send daily digest (0-59)
-            check_interval: Seconds between checks
+            check_interval: Seconds to wait after a digest attempt before re-checking
             send_on_startup: If True, send digest immediately on startup (for testing)
         """
         self.send_message = send_message
@@ -56,25 +61,21 @@ class NewsScheduler:
     def _load_state(self) -> None:
         """Load scheduler state from disk."""
         try:
-            import json
             if NEWS_STATE_FILE.exists():
-                with open(NEWS_STATE_FILE, 'r') as f:
-                    data = json.load(f)
-                    if data.get('last_digest_date'):
-                        self._last_digest_date = datetime.fromisoformat(data['last_digest_date'])
-                        logger.debug(f"News: Loaded last digest date: {self._last_digest_date}")
+                data = json_io.loads(NEWS_STATE_FILE.read_bytes())
+                if data.get('last_digest_date'):
+                    self._last_digest_date = datetime.fromisoformat(data['last_digest_date'])
+                    logger.debug(f"News: Loaded last digest date: {self._last_digest_date}")
         except Exception as e:
             logger.warning(f"News: Could not load state: {e}")
     
     def _save_state(self) -> None:
         """Save scheduler state to disk."""
         try:
-            import json
             data = {
                 'last_digest_date': self._last_digest_date.isoformat() if self._last_digest_date else None
             }
-            with open(NEWS_STATE_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            NEWS_STATE_FILE.write_bytes(json_io.dumps(data, indent=True))
         except Exception as e:
             logger.warning(f"News: Could not save state: {e}")
     
@@ -109,7 +110,13 @@ class NewsScheduler:
         
         while self._running:
             try:
-                await self._check_digest_time()
+                delay = self._seconds_until_next_digest()
+                if delay > 0:
+                    await asyncio.sleep(min(delay, self._MAX_SLEEP))
+                    continue
+                
+                await self._send_digest()
+                # Don't retry a failed digest in a tight loop
                 await asyncio.sleep(self.check_interval)
             except asyncio.CancelledError:
                 break
@@ -117,16 +124,17 @@ class NewsScheduler:
                 logger.error(f"News scheduler error: {e}")
                 await asyncio.sleep(self.check_interval)
     
-    async def _check_digest_time(self) -> None:
-        """Check if it's time to send the daily digest."""
-        now = datetime.now()
+    def _seconds_until_next_digest(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the next digest is due (0 if it is due now).
         
-        # Check if we already sent today
-        if self._last_digest_date and self._last_digest_date.date() == now.date():
-            return
+        If today's digest hasn't been sent and the scheduled time has passed,
+        it is due immediately. This handles cases where the laptop was asleep
+        during the scheduled time.
         
-        # Check if it's past the scheduled time - if so, send now
-        # This handles cases where the laptop was asleep during scheduled time
+        Args:
+            now: Current time (defaults to datetime.now())
+        """
+        now = now or datetime.now()
         target_datetime = now.replace(
             hour=self.digest_hour,
             minute=self.digest_minute,
@@ -134,9 +142,11 @@ class NewsScheduler:
             microsecond=0
         )
         
-        if now >= target_datetime:
-            # We're past the scheduled time and haven't sent today, send now
-            await self._send_digest()
+        # Already sent today: next digest is tomorrow
+        if self._last_digest_date and self._last_digest_date.date() == now.date():
+            target_datetime += timedelta(days=1)
+        
+        return max(0.0, (target_datetime - now).total_seconds())
     
     async def _send_digest(self) -> None:
         """Fetch news and send the digest."""
@@ -156,18 +166,22 @@ class NewsScheduler:
                 )
                 logger.info("News: No new articles to report")
             else:
+                # Header stats, counted once up front
+                article_count = len(articles)
+                source_count = len({a.source for a in articles})
+                
                 # Summarize with Gemini
-                logger.info(f"News: Summarizing {len(articles)} articles with Gemini...")
+                logger.info(f"News: Summarizing {article_count} articles with Gemini...")
                 summary = await self.summarize_with_gemini(articles)
                 
                 # Send the digest
                 message = (
                     f"📰 **Daily Gaming News Digest**\n"
-                    f"*{len(articles)} new articles from {len(set(a.source for a in articles))} sources*\n\n"
+                    f"*{article_count} new articles from {source_count} sources*\n\n"
                     f"{summary}"
                 )
                 await self.send_message(message)
-                logger.info(f"News: Sent digest with {len(articles)} articles")
+                logger.info(f"News: Sent digest with {article_count} articles")
                 
                 # Now that we've sent the message, mark articles as seen
                 scraper.mark_articles_as_seen(articles)
@@ -4,18 +4,21 @@ Fetches latest news from gaming industry websites via RSS feeds.
 Run standalone to test: python src/automations/news/scraper.py
 """
 
-import json
+import os
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
-from dataclasses import dataclass, asdict
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, List, Dict, Optional, Set
+from dataclasses import dataclass, field
 from pathlib import Path
-import xml.etree.ElementTree as ET
 import re
 
 import httpx
+from lxml import etree
 
 from config.settings import settings
+from src.utils import json_io
 
 # RSS feeds for all sources
 FEEDS = {
@@ -29,11 +32,99 @@ FEEDS = {
 NEWS_DATA_DIR = settings.DATA_DIR / "News"
 NEWS_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-# File to track seen articles (prevents duplicates across days)
-SEEN_ARTICLES_FILE = NEWS_DATA_DIR / "seen_articles.json"
+# Append-only log of seen articles (prevents duplicates across days).
+# One JSON object per line: {"link": ..., "ts": ...}
+SEEN_ARTICLES_FILE = NEWS_DATA_DIR / "seen_articles.ndjson"
 
+# Pre-log format ({"seen": {link: ts}}), migrated on first load
+LEGACY_SEEN_ARTICLES_FILE = NEWS_DATA_DIR / "seen_articles.json"
 
-@dataclass
+# Conditional-GET validators and last parsed articles per feed
+FEED_CACHE_FILE = NEWS_DATA_DIR / "feed_cache.json"
+
+# Feed element names: RSS 2.0 items and Atom entries
+_ATOM_NS_URI = "http://www.w3.org/2005/Atom"
+ITEM_TAG = "item"
+ATOM_ENTRY = f"{{{_ATOM_NS_URI}}}entry"
+
+
+def _field_xpath(*names: str, attr: str = "") -> etree.XPath:
+    """Compile an XPath returning the first RSS/Atom child field with any of names.
+    
+    Matches un-namespaced (RSS) and Atom children only, so extension
+    elements such as media:title are ignored. Plain strings are returned
+    (no smart strings) so results don't keep the parsed item alive.
+    """
+    names_test = " or ".join(f"local-name()='{name}'" for name in names)
+    return etree.XPath(
+        f"string(*[({names_test}) and (namespace-uri()='' or namespace-uri()='{_ATOM_NS_URI}')][1]{attr})",
+        smart_strings=False
+    )
+
+
+# Compiled once; each call is a single C-level pass over the item's children
+_TITLE_XPATH = _field_xpath("title")
+_LINK_XPATH = _field_xpath("link")
+_LINK_HREF_XPATH = _field_xpath("link", attr="/@href")
+_PUBLISHED_XPATH = _field_xpath("pubDate", "published")
+_SUMMARY_XPATH = _field_xpath("description", "summary")
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# HTTP client shared by all scraper instances, so pooled (HTTP/2) connections
+# survive across digests. Created lazily by _get_client().
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            timeout=30.0,
+            follow_redirects=True,  # Important for MobileGamer redirect
+            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        )
+    return _CLIENT
+
+
+def _published_ts(pub_date: str) -> Optional[float]:
+    """Parse an RSS (RFC 822) or Atom (ISO 8601) date to epoch seconds.
+    
+    Returns None if the date can't be parsed.
+    """
+    try:
+        return parsedate_to_datetime(pub_date).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(pub_date).timestamp()
+    except ValueError:
+        return None
+
+
+def _published_before(pub_date: Optional[str], cutoff: float) -> bool:
+    """Check whether a feed date is known to be earlier than a cutoff.
+    
+    Missing or unparseable dates are never treated as too old.
+    """
+    if not pub_date:
+        return False
+    published = _published_ts(pub_date)
+    return published is not None and published < cutoff
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (call on shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+@dataclass(slots=True)
 class NewsArticle:
     """Represents a single news article."""
     title: str
@@ -43,50 +134,106 @@ class NewsArticle:
     summary: Optional[str] = None
 
 
+@dataclass
+class _FeedCache:
+    """Validators from a feed's last 200 response and the articles it held."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    parsed_articles: List[NewsArticle] = field(default_factory=list)
+
+
 class SeenArticlesTracker:
     """Tracks which articles have been sent to avoid duplicates.
     
     Stores article links with timestamps, auto-cleans entries older than retention_days.
+    New links are appended to an NDJSON log; the log is only rewritten
+    (compacted) on load when entries have expired or been duplicated.
     """
     
     def __init__(self, retention_days: int = 7):
         self.retention_days = retention_days
-        self.seen: Dict[str, str] = {}  # link -> timestamp ISO format
+        self.seen: Dict[str, float] = {}  # link -> UNIX timestamp (seconds)
         self._load()
     
     def _load(self) -> None:
-        """Load seen articles from disk."""
+        """Load seen articles from disk and compact the log if needed."""
         try:
             if SEEN_ARTICLES_FILE.exists():
-                with open(SEEN_ARTICLES_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.seen = data.get('seen', {})
-                    self._cleanup_old()
+                lines = 0
+                with open(SEEN_ARTICLES_FILE, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        entry = json_io.loads(line)
+                        self.seen[entry['link']] = entry['ts']
+                        lines += 1
+                needs_compact = lines != len(self.seen)
+            elif LEGACY_SEEN_ARTICLES_FILE.exists():
+                data = json_io.loads(LEGACY_SEEN_ARTICLES_FILE.read_bytes())
+                self.seen = data.get('seen', {})
+                needs_compact = True
+            else:
+                return
+            
+            # Migrate ISO-string timestamps from older versions to epoch seconds
+            if any(isinstance(ts, str) for ts in self.seen.values()):
+                self.seen = self._migrate_timestamps(self.seen)
+                needs_compact = True
+            
+            if self._cleanup_old() or needs_compact:
+                self._compact()
         except Exception as e:
             print(f"Warning: Could not load seen articles: {e}")
             self.seen = {}
     
-    def _save(self) -> None:
-        """Save seen articles to disk."""
+    @staticmethod
+    def _migrate_timestamps(seen: Dict[str, Any]) -> Dict[str, float]:
+        """Convert ISO timestamps to epoch seconds, dropping invalid ones."""
+        migrated = {}
+        for link, ts in seen.items():
+            if isinstance(ts, str):
+                try:
+                    ts = datetime.fromisoformat(ts).timestamp()
+                except ValueError:
+                    continue
+            migrated[link] = ts
+        return migrated
+    
+    def _append(self, links: List[str], timestamp: float) -> None:
+        """Append newly seen links to the log."""
         try:
-            with open(SEEN_ARTICLES_FILE, 'w', encoding='utf-8') as f:
-                json.dump({'seen': self.seen}, f, indent=2)
+            with open(SEEN_ARTICLES_FILE, 'ab') as f:
+                f.write(b''.join(
+                    json_io.dumps({'link': link, 'ts': timestamp}) + b'\n'
+                    for link in links
+                ))
         except Exception as e:
             print(f"Warning: Could not save seen articles: {e}")
     
-    def _cleanup_old(self) -> None:
-        """Remove entries older than retention_days."""
-        cutoff = datetime.now() - timedelta(days=self.retention_days)
-        to_remove = []
-        for link, timestamp in self.seen.items():
-            try:
-                if datetime.fromisoformat(timestamp) < cutoff:
-                    to_remove.append(link)
-            except:
-                to_remove.append(link)  # Invalid timestamp, remove it
+    def _compact(self) -> None:
+        """Rewrite the log with only the current entries."""
+        try:
+            tmp_file = SEEN_ARTICLES_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(b''.join(
+                    json_io.dumps({'link': link, 'ts': ts}) + b'\n'
+                    for link, ts in self.seen.items()
+                ))
+            os.replace(tmp_file, SEEN_ARTICLES_FILE)
+        except Exception as e:
+            print(f"Warning: Could not compact seen articles: {e}")
+    
+    def _cleanup_old(self) -> bool:
+        """Remove entries older than retention_days.
         
-        for link in to_remove:
-            del self.seen[link]
+        Returns:
+            True if any entries were removed
+        """
+        cutoff = time.time() - self.retention_days * 86400
+        kept = {link: ts for link, ts in self.seen.items() if ts >= cutoff}
+        removed = len(kept) != len(self.seen)
+        self.seen = kept
+        return removed
     
     def is_seen(self, link: str) -> bool:
         """Check if an article has already been sent."""
@@ -94,14 +241,17 @@ class SeenArticlesTracker:
     
     def mark_seen(self, links: List[str]) -> None:
         """Mark articles as seen."""
-        now = datetime.now().isoformat()
-        for link in links:
+        now = time.time()
+        new_links = [link for link in links if link not in self.seen]
+        for link in new_links:
             self.seen[link] = now
-        self._save()
+        if new_links:
+            self._append(new_links, now)
     
     def filter_new(self, articles: List['NewsArticle']) -> List['NewsArticle']:
         """Filter out articles that have already been seen."""
-        return [a for a in articles if not self.is_seen(a.link)]
+        seen = self.seen
+        return [a for a in articles if a.link not in seen]
 
 
 class NewsScraper:
@@ -111,14 +261,44 @@ class NewsScraper:
         self.max_articles = max_articles_per_source
         self.track_seen = track_seen
         self.seen_tracker = SeenArticlesTracker() if track_seen else None
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,  # Important for MobileGamer redirect
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        )
+        self._feed_cache: Dict[str, _FeedCache] = self._load_feed_cache()
+        self._feed_cache_dirty = False
+        self.client = _get_client()
     
     async def close(self):
-        await self.client.aclose()
+        """Release the scraper. The shared HTTP client stays open for reuse."""
+    
+    @staticmethod
+    def _load_feed_cache() -> Dict[str, _FeedCache]:
+        """Load per-feed ETag/Last-Modified validators from disk."""
+        try:
+            if not FEED_CACHE_FILE.exists():
+                return {}
+            data = json_io.loads(FEED_CACHE_FILE.read_bytes())
+            return {
+                source: _FeedCache(
+                    etag=entry.get('etag'),
+                    last_modified=entry.get('last_modified'),
+                    parsed_articles=[NewsArticle(**a) for a in entry.get('parsed_articles', [])]
+                )
+                for source, entry in data.items()
+            }
+        except Exception as e:
+            print(f"Warning: Could not load feed cache: {e}")
+            return {}
+    
+    def _save_feed_cache(self) -> None:
+        """Write the feed cache to disk if any feed changed."""
+        if not self._feed_cache_dirty:
+            return
+        try:
+            # Write to a temp file and swap it in, so a crash can't truncate the cache
+            tmp_file = FEED_CACHE_FILE.with_suffix('.tmp')
+            tmp_file.write_bytes(json_io.dumps(self._feed_cache))
+            os.replace(tmp_file, FEED_CACHE_FILE)
+            self._feed_cache_dirty = False
+        except Exception as e:
+            print(f"Warning: Could not save feed cache: {e}")
     
     async def fetch_all(self, filter_seen: bool = False) -> List[NewsArticle]:
         """Fetch news from all sources.
@@ -139,6 +319,7 @@ class NewsScraper:
                 print(f"Error fetching source: {result}")
             else:
                 articles.extend(result)
+        self._save_feed_cache()
         
         # Filter out seen articles if requested
         if filter_seen and self.seen_tracker:
@@ -173,43 +354,75 @@ class NewsScraper:
             print(f"Marked {len(articles)} articles as seen")
     
     async def _fetch_rss(self, source: str, url: str) -> List[NewsArticle]:
-        """Fetch articles from an RSS feed."""
+        """Fetch articles from an RSS feed.
+        
+        The response body is fed to lxml's pull parser as it downloads, and
+        each item is discarded once converted, so no full DOM is built.
+        Requests are conditional on the feed's last ETag/Last-Modified; a
+        304 Not Modified reuses the articles parsed from the previous body.
+        """
+        cache = self._feed_cache.get(source)
+        headers = {}
+        if cache:
+            if cache.etag:
+                headers['If-None-Match'] = cache.etag
+            if cache.last_modified:
+                headers['If-Modified-Since'] = cache.last_modified
+        
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
-            
-            # Parse RSS XML
-            root = ET.fromstring(response.text)
+            parser = etree.XMLPullParser(
+                events=('end',),
+                tag=(ITEM_TAG, ATOM_ENTRY),
+                recover=True,
+                resolve_entities=False
+            )
             articles = []
             
-            # Handle both RSS 2.0 and Atom formats
-            items = root.findall(".//item") or root.findall(".//{http://www.w3.org/2005/Atom}entry")
+            # Items older than the seen-tracker retention would look new again
+            # once their links expire from the tracker, so drop them up front
+            cutoff = (
+                time.time() - self.seen_tracker.retention_days * 86400
+                if self.seen_tracker else None
+            )
+            
+            async with self.client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and cache:
+                    articles = cache.parsed_articles
+                    if cutoff is not None:
+                        # Cached items age too; apply the same cutoff as a fresh parse
+                        articles = [a for a in articles if not _published_before(a.published, cutoff)]
+                        if len(articles) < len(cache.parsed_articles):
+                            cache.parsed_articles = articles
+                            self._feed_cache_dirty = True
+                    print(f"✓ {source}: not modified ({len(articles)} cached articles)")
+                    return articles
+                response.raise_for_status()
+                etag = response.headers.get('etag')
+                last_modified = response.headers.get('last-modified')
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        article = self._parse_item(elem, source, cutoff)
+                        if article:
+                            articles.append(article)
+                        
+                        # Free the processed item and any earlier siblings
+                        elem.clear(keep_tail=True)
+                        parent = elem.getparent()
+                        if parent is not None:
+                            while elem.getprevious() is not None:
+                                del parent[0]
+                        
+                        if len(articles) >= self.max_articles:
+                            break
+                    if len(articles) >= self.max_articles:
+                        break
             
-            for item in items[:self.max_articles]:
-                # RSS 2.0 format
-                title = item.findtext("title") or item.findtext("{http://www.w3.org/2005/Atom}title")
-                link = item.findtext("link") or item.findtext("{http://www.w3.org/2005/Atom}link")
-                if link is None:
-                    link_elem = item.find("{http://www.w3.org/2005/Atom}link")
-                    if link_elem is not None:
-                        link = link_elem.get("href")
-                
-                pub_date = item.findtext("pubDate") or item.findtext("{http://www.w3.org/2005/Atom}published")
-                description = item.findtext("description") or item.findtext("{http://www.w3.org/2005/Atom}summary")
-                
-                # Clean up description (remove HTML tags)
-                if description:
-                    description = re.sub(r'<[^>]+>', '', description)
-                    description = description[:300] + "..." if len(description) > 300 else description
-                
-                if title and link:
-                    articles.append(NewsArticle(
-                        title=title.strip(),
-                        link=link.strip(),
-                        source=source,
-                        published=pub_date,
-                        summary=description.strip() if description else None
-                    ))
+            if etag or last_modified:
+                self._feed_cache[source] = _FeedCache(etag, last_modified, articles)
+                self._feed_cache_dirty = True
+            elif self._feed_cache.pop(source, None):
+                self._feed_cache_dirty = True
             
             print(f"✓ {source}: {len(articles)} articles")
             return articles
@@ -217,7 +430,41 @@ class NewsScraper:
         except Exception as e:
             print(f"✗ {source}: {e}")
             return []
-
+    
+    @staticmethod
+    def _parse_item(item, source: str, cutoff: Optional[float] = None) -> Optional[NewsArticle]:
+        """Convert an RSS <item> or Atom <entry> element to a NewsArticle.
+        
+        Args:
+            item: The feed element
+            source: Feed name
+            cutoff: Skip items published before this epoch time (if known)
+        """
+        pub_date = _PUBLISHED_XPATH(item) or None
+        if cutoff is not None and _published_before(pub_date, cutoff):
+            return None
+        
+        title = _TITLE_XPATH(item)
+        link = _LINK_XPATH(item) or _LINK_HREF_XPATH(item)
+        description = _SUMMARY_XPATH(item)
+        
+        # Clean up description (remove HTML tags); plain-text summaries skip the regex
+        if description:
+            if '<' in description:
+                description = _HTML_TAG_RE.sub('', description)
+            if len(description) > 300:
+                description = description[:300] + "..."
+        
+        if not (title and link):
+            return None
+        
+        return NewsArticle(
+            title=title.strip(),
+            link=link.strip(),
+            source=source,
+            published=pub_date,
+            summary=description.strip() if description else None
+        )
 
 async def main():
     """Test the scraper and output JSON."""
@@ -254,14 +501,13 @@ async def main():
             "fetched_at": datetime.now().isoformat(),
             "total_articles": len(articles),
             "mode": "digest" if use_digest else "all",
-            "articles": [asdict(a) for a in articles]
+            "articles": articles  # dataclasses are encoded natively
         }
         
         # Save to file with date stamp
         date_str = datetime.now().strftime("%Y-%m-%d")
         output_file = NEWS_DATA_DIR / f"news_{date_str}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(json_io.dumps(output, indent=True))
         
         print(f"Saved to: {output_file}")
         print()
@@ -278,6 +524,7 @@ async def main():
         
     finally:
         await scraper.close()
+        await close_client()
 
 
 if __name__ == "__main__":
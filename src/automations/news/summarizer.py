@@ -1,93 +1,556 @@
 """Gemini-powered news summarization."""
 
+import asyncio
+import hashlib
+import os
 import re
-from typing import List
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from src.automations.news.scraper import NewsArticle
+from src.automations.news.scraper import NewsArticle, NEWS_DATA_DIR
 from src.gemini.cli_wrapper import GeminiCLI
+from src.utils import json_io
 from src.utils.logger import logger
 
+# Finished summaries keyed by a hash of the summarized articles (LRU).
+# Each entry is {"links": [...], "raw": summary with numbered references}.
+SUMMARY_CACHE_FILE = NEWS_DATA_DIR / "summary_cache.json"
+_SUMMARY_CACHE_MAX = 64
+_summary_cache: Optional["OrderedDict[str, Dict[str, Any]]"] = None
 
-def _replace_refs_with_links(text: str, articles: List[NewsArticle]) -> str:
-    """Replace article references with clickable links.
+# Article limits: one Gemini call summarizes up to _SHARD_SIZE articles;
+# larger sets are split into even shards summarized concurrently and merged
+MAX_ARTICLES = 60
+_SHARD_SIZE = 20
+_MAX_CONCURRENT_SHARDS = 3
+
+# Batches up to this size put each article's URL in the prompt and Gemini
+# writes the links itself, so the response needs no reference rewriting;
+# larger batches use bare article numbers to save input tokens
+INLINE_URL_THRESHOLD = 15
+
+_NO_RESPONSE = "(No response from Gemini)"
+
+
+# Static scaffold of the summary prompt, in a numbered-reference and an
+# inline-URL variant. Each is byte-identical across calls and always sent
+# first, so Gemini's implicit prefix caching can reuse it; only the article
+# count and list that follow it change.
+_PROMPT_TEMPLATE = """You are a gaming industry analyst providing a daily news briefing for a venture capital investor focused on games.
+
+Summarize the following gaming industry news articles into a concise, scannable digest. Focus on:
+- Major business moves (funding, M&A, partnerships)
+- Market trends and data
+- Notable company news (especially mobile, F2P, SEA/Vietnam relevance)
+- Regulatory developments
+
+Format your response as a clean Markdown list designed for Telegram.
+Use this EXACT format:
+
+**TOP STORIES**
+• **Headline 1**: Brief summary (1-2 sentences). [1]{link}
+• **Headline 2**: Brief summary. [2]{link}
+
+**BUSINESS & FUNDING**
+• **Company**: Details of deal/funding ($Amount). [3]{link}
+
+**MARKET TRENDS**
+• Trend or data point. [4]{link}
+
+**QUICK HITS**
+• Brief item. [5]{link}
+
+**Rules:**
+- Use "• " (bullet point + space) for every item.
+- **Bold** the company name or main subject at the start of each bullet.
+{ref_rule}
+- Leave an empty line between sections.
+- Keep it concise and scannable. Avoid long paragraphs.
+
+---
+ARTICLES ("""
+
+_PROMPT_HEAD = _PROMPT_TEMPLATE.format(
+    link="",
+    ref_rule="- ALWAYS end each bullet with the article number in brackets like [1], [2], etc."
+)
+_INLINE_PROMPT_HEAD = _PROMPT_TEMPLATE.format(
+    link="(URL)",
+    ref_rule=(
+        "- ALWAYS end each bullet with a Markdown link to its article: the article number "
+        "in brackets followed by the article's Link in parentheses, like [1](URL).\n"
+        "- Copy each Link exactly as given."
+    )
+)
+
+_ARTICLES_COUNT_END = """ total):
+"""
+
+_SUMMARY_FOOTER = "\n"
+
+# Section heading line in the summary, e.g. "**TOP STORIES**"
+_SECTION_HEADING_RE = re.compile(r'^\*\*[^*\n]+\*\*[ \t]*\n', re.MULTILINE)
+
+# Article reference formats in Gemini's output, matched in a single pass
+_REF_RE = re.compile(
+    r'\[(\d+(?:\s*,\s*\d+)+)\]'                       # 1: [10, 13, 15]
+    r'|\[(\d+)\]'                                    # 2: [1]
+    r'|(\d+(?:[^\S\n]*,[^\S\n]*\d+)*)[^\S\n]*$',        # 3: trailing "10, 13" at end of line
+    re.MULTILINE
+)
+_NON_SPACE_RE = re.compile(r'\S')
+# A line ending in a digit (the only way a reference can appear without '[')
+_TRAILING_DIGIT_RE = re.compile(r'\d[^\S\n]*$', re.MULTILINE)
+
+# Fields read for each article when building the prompt (one C-level call each)
+_PROMPT_FIELDS = attrgetter('title', 'source', 'summary')
+
+# Delimiters for several summary prompts combined into one Gemini call
+_BATCH_PREAMBLE = """You will receive {count} independent summarization requests, each starting with a line like ===PROMPT 1===.
+Answer every request separately. Start each answer with its own line ===SUMMARY N=== (N is the request number) and write nothing outside the answers.
+
+"""
+_BATCH_PROMPT_MARK = "===PROMPT %d===\n"
+_BATCH_SUMMARY_RE = re.compile(r'^===SUMMARY (\d+)===[ \t]*$', re.MULTILINE)
+
+# Escapes parentheses in URLs so they don't end a Markdown link early
+_PAREN_TABLE = str.maketrans({'(': '%28', ')': '%29'})
+
+
+def _summary_key(articles: List[NewsArticle]) -> str:
+    """Stable key for an article set (order-independent).
+    
+    Titles are included so an article whose headline was edited
+    gets a fresh summary.
+    """
+    entries = sorted(f"{a.link}\t{a.title}".encode('utf-8') for a in articles)
+    return hashlib.blake2b(b'\n'.join(entries), digest_size=16).hexdigest()
+
+
+def _get_summary_cache() -> "OrderedDict[str, Dict[str, Any]]":
+    """Get the summary cache, loading it from disk on first use."""
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = OrderedDict()
+        try:
+            if SUMMARY_CACHE_FILE.exists():
+                data = json_io.loads(SUMMARY_CACHE_FILE.read_bytes())
+                # Entries from older versions (plain strings) can't be relinked; drop them
+                _summary_cache.update(
+                    (key, entry) for key, entry in data.items() if isinstance(entry, dict)
+                )
+        except Exception as e:
+            logger.warning(f"Could not load summary cache: {e}")
+    return _summary_cache
+
+
+def _find_cached_summary(key: str) -> Optional[Dict[str, Any]]:
+    """Find the cached summary for exactly this article set.
+    
+    Only exact matches are reused: the whole batch is marked as seen once the
+    digest is sent, so a summary of a different set would either drop new
+    stories or repeat already-seen ones.
+    
+    Args:
+        key: Exact-match cache key for the articles
+        
+    Returns:
+        The cache entry, or None
+    """
+    cache = _get_summary_cache()
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    return None
+
+
+def _store_summary(key: str, links: List[str], raw_summary: str, inline_urls: bool = False) -> None:
+    """Add a summary to the cache, evicting the oldest entries, and persist it."""
+    cache = _get_summary_cache()
+    cache[key] = {'links': links, 'raw': raw_summary}
+    if inline_urls:
+        # Already linked by Gemini; must not be relinked
+        cache[key]['inline'] = True
+    cache.move_to_end(key)
+    while len(cache) > _SUMMARY_CACHE_MAX:
+        cache.popitem(last=False)
+    try:
+        # Write to a temp file and swap it in, so a crash can't truncate the cache
+        tmp_file = SUMMARY_CACHE_FILE.with_suffix('.tmp')
+        tmp_file.write_bytes(json_io.dumps(cache))
+        os.replace(tmp_file, SUMMARY_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Could not save summary cache: {e}")
+
+
+class _SummaryBatcher:
+    """Coalesces summary prompts that back up behind a running Gemini call.
+    
+    A prompt is sent as soon as no batch is in flight, so a lone caller
+    never waits. Prompts that arrive while a call is running are queued and
+    sent together (up to MAX_BATCH per call) when it finishes, as one
+    delimited request whose response is split back into one summary each.
+    """
+    
+    MAX_BATCH = 4
+    
+    def __init__(self):
+        self._pending: List[Tuple[GeminiCLI, str, asyncio.Future]] = []
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def submit(self, gemini: GeminiCLI, prompt: str) -> str:
+        """Queue a prompt and wait for its summary.
+        
+        Args:
+            gemini: GeminiCLI instance to use
+            prompt: The summary prompt
+            
+        Returns:
+            Gemini's response to this prompt
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((gemini, prompt, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return await future
+    
+    async def _run(self) -> None:
+        """Send queued prompts, one batch at a time, until none are left."""
+        while self._pending:
+            # Prompts for different GeminiCLI instances are never combined
+            gemini = self._pending[0][0]
+            batch: List[Tuple[str, asyncio.Future]] = []
+            rest = []
+            for item in self._pending:
+                if item[0] is gemini and len(batch) < self.MAX_BATCH and not item[2].done():
+                    batch.append((item[1], item[2]))
+                elif not item[2].done():
+                    rest.append(item)
+            self._pending = rest
+            if batch:
+                await self._send(gemini, batch)
+    
+    async def _send(self, gemini: GeminiCLI, items: List[Tuple[str, asyncio.Future]]) -> None:
+        """Send one batch and resolve each prompt's future."""
+        try:
+            if len(items) == 1:
+                responses = [await gemini.send_message(items[0][0], use_mcp=False)]
+            else:
+                responses = await self._send_combined(gemini, [prompt for prompt, _ in items])
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), response in zip(items, responses):
+            if not future.done():
+                future.set_result(response)
+    
+    async def _send_combined(self, gemini: GeminiCLI, prompts: List[str]) -> List[str]:
+        """Send several prompts as one request and split the response."""
+        combined = _BATCH_PREAMBLE.format(count=len(prompts)) + "\n".join(
+            _BATCH_PROMPT_MARK % i + prompt for i, prompt in enumerate(prompts, 1)
+        )
+        response = await gemini.send_message(combined, use_mcp=False)
+        
+        answers: Dict[int, str] = {}
+        matches = list(_BATCH_SUMMARY_RE.finditer(response))
+        for match, end in zip(matches, [m.start() for m in matches[1:]] + [len(response)]):
+            answers[int(match.group(1))] = response[match.end():end].strip()
+        if all(answers.get(i) for i in range(1, len(prompts) + 1)):
+            return [answers[i] for i in range(1, len(prompts) + 1)]
+        
+        # Gemini didn't keep the delimiters; fall back to one call per prompt
+        logger.warning(f"Could not split batched summary response; resending {len(prompts)} prompts")
+        return list(await asyncio.gather(
+            *(gemini.send_message(prompt, use_mcp=False) for prompt in prompts)
+        ))
+
+
+_batcher = _SummaryBatcher()
+
+
+def _ref_replacer(links: List[str]) -> Callable[[str], str]:
+    """Build a function that replaces article references with clickable links.
     
     Handles multiple formats Gemini may output:
     - [1] - individual bracketed reference
     - [10, 13, 15] - grouped bracketed references  
     - 10, 13, 15 - bare trailing numbers at end of line
     
+    The links are rendered once, the first time a reference is found, so
+    the returned function can be applied cheaply to many pieces of text
+    (e.g. each line of a streamed summary) and costs nothing for text
+    without references.
+    
     Args:
-        text: The Gemini output containing references
-        articles: List of articles to map indices to URLs
+        links: Article URLs, in the order the articles were numbered
         
     Returns:
-        Text with references replaced by clickable markdown links
+        Function mapping Gemini output to text with references replaced
+        by clickable markdown links
     """
-    # Build a mapping of article numbers to URLs
-    url_map = {i+1: a.link for i, a in enumerate(articles)}
-    max_num = len(articles)
-    
-    # Replace function for any number reference
-    def make_link(num: int) -> str:
-        if num in url_map:
-            # Escape parentheses in URL for markdown
-            url = url_map[num].replace('(', '%28').replace(')', '%29')
-            return f"[{num}]({url})"
-        return str(num)
+    # Rendered Markdown link keyed by the reference's digits as written
+    # ("1" ... "30"), filled on first use
+    link_strs: Dict[str, str] = {}
+    
+    def link_for(num_str: str) -> Optional[str]:
+        """Look up the link for a reference number, or None if out of range."""
+        link = link_strs.get(num_str)
+        if link is None and num_str.startswith('0'):
+            # Zero-padded reference such as "07"
+            link = link_strs.get(str(int(num_str)))
+        return link
     
     def nums_to_links(nums_str: str) -> str:
         """Convert a comma-separated string of numbers to linked format."""
-        parts = re.split(r'\s*,\s*', nums_str.strip())
-        linked = []
-        for part in parts:
-            part = part.strip()
-            if part.isdigit():
-                num = int(part)
-                if 1 <= num <= max_num:
-                    linked.append(make_link(num))
-                else:
-                    linked.append(part)
-            else:
-                linked.append(part)
-        return ', '.join(linked)
+        # The match is only digits, commas and whitespace: drop the whitespace
+        # (str.split() uses the same definition as \s) and split on commas.
+        # Out-of-range numbers are kept as written.
+        parts = "".join(nums_str.split()).split(',')
+        return ', '.join(link_for(part) or part for part in parts)
+    
+    def replace_ref(match):
+        kind = match.lastindex
+        if kind == 1:
+            # Grouped brackets [N, N, N]
+            return nums_to_links(match.group(1))
+        if kind == 2:
+            # Individual bracket [N]
+            num_str = match.group(2)
+            return link_for(num_str) or str(int(num_str))
+        
+        # Trailing bare numbers: only if there's content before them on the line
+        # (searched in place within the line, without slicing it out)
+        text = match.string
+        start = match.start()
+        line_start = text.rfind('\n', 0, start) + 1
+        if not _NON_SPACE_RE.search(text, line_start, start):
+            return match.group(0)
+        return nums_to_links(match.group(3))
+    
+    def replace(text: str) -> str:
+        # Nothing to replace (e.g. an error message or a plain line)
+        if '[' not in text and not _TRAILING_DIGIT_RE.search(text):
+            return text
+        
+        # Render every link once, keyed by its number's text, so a reference
+        # is a single dict lookup on the matched digits with no int() parse.
+        # Most links have no parentheses and are used as-is.
+        if not link_strs:
+            link_strs.update(
+                (str(i), f"[{i}]({link if '(' not in link and ')' not in link else link.translate(_PAREN_TABLE)})")
+                for i, link in enumerate(links, 1)
+            )
+        return _REF_RE.sub(replace_ref, text)
+    
+    return replace
+
+
+def _replace_refs_with_links(text: str, links: List[str]) -> str:
+    """Replace article references with clickable links.
     
-    # Step 1: Replace grouped brackets [N, N, N] with linked versions
-    def replace_grouped(match):
-        return nums_to_links(match.group(1))
+    Args:
+        text: The Gemini output containing references
+        links: Article URLs, in the order the articles were numbered
+        
+    Returns:
+        Text with references replaced by clickable markdown links
+    """
+    return _ref_replacer(links)(text)
+
+
+def _build_summary_prompt(
+    articles: List[NewsArticle],
+    start: int = 1,
+    inline_urls: bool = False
+) -> str:
+    """Build the summary prompt for a list of articles.
+    
+    Args:
+        articles: Articles to summarize
+        start: Number of the first article (shards continue the numbering
+            so references stay unique across the merged summary)
+        inline_urls: Include each article's URL and have Gemini write the
+            links itself
+        
+    Returns:
+        The prompt text
+    """
+    if inline_urls:
+        # URLs are pre-escaped so Gemini can copy them straight into Markdown
+        article_text = "\n\n".join(
+            "[%d] **%s** (%s)\nLink: %s\n%s" % (
+                i, a.title, a.source, a.link.translate(_PAREN_TABLE), a.summary or 'No summary available.'
+            )
+            for i, a in enumerate(articles, start)
+        )
+        return f"{_INLINE_PROMPT_HEAD}{len(articles)}{_ARTICLES_COUNT_END}{article_text}{_SUMMARY_FOOTER}"
+    
+    # Numbered articles (no URLs to keep it short)
+    article_text = "\n\n".join(
+        "[%d] **%s** (%s)\n%s" % (i, title, source, summary or 'No summary available.')
+        for i, (title, source, summary) in enumerate(map(_PROMPT_FIELDS, articles), start)
+    )
+    return f"{_PROMPT_HEAD}{len(articles)}{_ARTICLES_COUNT_END}{article_text}{_SUMMARY_FOOTER}"
+
+
+def _merge_sections(responses: List[str]) -> str:
+    """Merge shard summaries, combining bullets under matching section headings.
+    
+    Args:
+        responses: Summaries in shard order
+        
+    Returns:
+        One summary with each section heading appearing once, in the
+        order the headings were first seen
+    """
+    preamble: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    for response in responses:
+        matches = list(_SECTION_HEADING_RE.finditer(response))
+        head = response[:matches[0].start()] if matches else response
+        if head.strip():
+            preamble.append(head.strip())
+        for match, end in zip(matches, [m.start() for m in matches[1:]] + [len(response)]):
+            body = response[match.end():end].strip()
+            if body:
+                sections.setdefault(match.group(0).strip(), []).append(body)
+    
+    parts = ["\n".join(preamble)] if preamble else []
+    parts.extend(f"{heading}\n" + "\n".join(bodies) for heading, bodies in sections.items())
+    return "\n\n".join(parts)
+
+
+async def _summarize_shards(
+    gemini: GeminiCLI,
+    articles: List[NewsArticle],
+    links: List[str],
+    on_progress: Optional[Callable[[str], Awaitable[None]]]
+) -> Tuple[str, bool]:
+    """Summarize a large article set as concurrent shards and merge the results.
+    
+    Args:
+        gemini: GeminiCLI instance to use
+        articles: Articles to summarize (more than _SHARD_SIZE)
+        links: The articles' links, in the same order
+        on_progress: Optional callback, called with the merged summary so far
+            (links replaced) each time a shard finishes
+        
+    Returns:
+        Tuple of (raw merged summary, whether every shard succeeded)
+        
+    Raises:
+        Exception: The first shard error, if no shard succeeded
+    """
+    shard_count = -(-len(articles) // _SHARD_SIZE)
+    size = -(-len(articles) // shard_count)
+    starts = range(0, len(articles), size)
+    responses: List[Optional[str]] = [None] * len(starts)
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SHARDS)
     
-    result = re.sub(r'\[(\d+(?:\s*,\s*\d+)+)\]', replace_grouped, text)
+    async def run_shard(index: int, start: int) -> None:
+        prompt = _build_summary_prompt(articles[start:start + size], start + 1)
+        async with semaphore:
+            response = await gemini.send_message(prompt, use_mcp=False)
+        if response == _NO_RESPONSE:
+            return
+        responses[index] = response
+        if on_progress:
+            try:
+                merged = _merge_sections([r for r in responses if r])
+                await on_progress(_replace_refs_with_links(merged, links))
+            except Exception as e:
+                logger.warning(f"News summary progress callback failed: {e}")
     
-    # Step 2: Replace individual brackets [N]
-    def replace_single(match):
-        num = int(match.group(1))
-        return make_link(num)
+    results = await asyncio.gather(
+        *(run_shard(i, start) for i, start in enumerate(starts)),
+        return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, Exception)]
+    for error in errors:
+        logger.error(f"Gemini summary shard failed: {error}")
     
-    result = re.sub(r'\[(\d+)\]', replace_single, result)
+    done = [r for r in responses if r]
+    if not done:
+        if errors:
+            raise errors[0]
+        return _NO_RESPONSE, True
+    return _merge_sections(done), len(done) == len(responses)
+
+
+async def _stream_summary(
+    gemini: GeminiCLI,
+    prompt: str,
+    relink: Callable[[str], str],
+    on_progress: Callable[[str], Awaitable[None]]
+) -> Tuple[str, str]:
+    """Stream a summary from Gemini, reporting each completed section.
     
-    # Step 3: Process trailing bare numbers at end of lines
-    lines = result.split('\n')
-    processed_lines = []
+    References are relinked line by line as the stream arrives, so the
+    linked summary is ready as soon as the stream ends.
     
-    for line in lines:
-        # Match trailing numbers like "1, 2" or "3" at end of line
-        match = re.search(r'(\d+(?:\s*,\s*\d+)*)\s*$', line)
-        if match:
-            refs_str = match.group(1)
-            prefix = line[:match.start()]
-            # Only process if there's content before the numbers
-            if prefix.strip():
-                line = prefix + nums_to_links(refs_str)
+    Args:
+        gemini: GeminiCLI instance to use
+        prompt: The summary prompt
+        relink: Replaces references in one line (see _ref_replacer)
+        on_progress: Called with the summary so far (links replaced)
+            each time a new section heading starts
         
-        processed_lines.append(line)
+    Returns:
+        Tuple of (raw summary, summary with links replaced)
+    """
+    raw_parts: List[str] = []
+    linked: List[str] = []
+    has_content = False
+    pending = ""
+    async for chunk in gemini.send_message_stream(prompt, use_mcp=False):
+        raw_parts.append(chunk)
+        pending += chunk
+        if '\n' not in chunk:
+            continue
+        
+        # Relink each completed line; a heading line means the previous
+        # section is finished
+        start = 0
+        end = pending.find('\n')
+        while end != -1:
+            if has_content and _SECTION_HEADING_RE.match(pending, start):
+                try:
+                    await on_progress("".join(linked).rstrip())
+                except Exception as e:
+                    logger.warning(f"News summary progress callback failed: {e}")
+            line = pending[start:end]
+            linked.append(relink(line))
+            linked.append('\n')
+            has_content = has_content or not line.isspace() and bool(line)
+            start = end + 1
+            end = pending.find('\n', start)
+        pending = pending[start:]
     
-    return '\n'.join(processed_lines)
+    linked.append(relink(pending))
+    raw = "".join(raw_parts).strip()
+    if not raw:
+        return _NO_RESPONSE, _NO_RESPONSE
+    return raw, "".join(linked).strip()
 
 
-async def summarize_articles(articles: List[NewsArticle]) -> str:
+async def summarize_articles(
+    articles: List[NewsArticle],
+    gemini: Optional[GeminiCLI] = None,
+    on_progress: Optional[Callable[[str], Awaitable[None]]] = None
+) -> str:
     """Summarize a list of news articles using Gemini CLI.
     
     Args:
         articles: List of NewsArticle objects to summarize
+        gemini: GeminiCLI instance to use (defaults to the shared singleton)
+        on_progress: Optional callback for streaming. When given, the response
+            is streamed and this is called with the partial summary each time
+            a section completes (or, for sharded sets, each time a shard
+            completes).
         
     Returns:
         A formatted summary string
@@ -95,67 +558,58 @@ async def summarize_articles(articles: List[NewsArticle]) -> str:
     if not articles:
         return "No articles to summarize."
     
-    # Limit articles to top 30 for faster processing
-    articles = articles[:30]
-    
-    # Use GeminiCLI wrapper
-    gemini = GeminiCLI.get_instance()
+    # Limit articles; sets above _SHARD_SIZE are summarized in concurrent shards
+    articles = articles[:MAX_ARTICLES]
     
-    # Build the prompt with numbered articles (no URLs to keep it short)
-    article_text = "\n\n".join([
-        f"[{i+1}] **{a.title}** ({a.source})\n{a.summary or 'No summary available.'}"
-        for i, a in enumerate(articles)
-    ])
+    # Reuse the summary if this exact article set was summarized before;
+    # references are relinked using the cached article order
+    links = [a.link for a in articles]
+    cache_key = _summary_key(articles)
+    cached = _find_cached_summary(cache_key)
+    if cached:
+        logger.info("Using cached news summary")
+        if cached.get('inline'):
+            return cached['raw']
+        return _replace_refs_with_links(cached['raw'], cached['links'])
     
-    prompt = f"""You are a gaming industry analyst providing a daily news briefing for a venture capital investor focused on games.
-
-Summarize the following {len(articles)} gaming industry news articles into a concise, scannable digest. Focus on:
-- Major business moves (funding, M&A, partnerships)
-- Market trends and data
-- Notable company news (especially mobile, F2P, SEA/Vietnam relevance)
-- Regulatory developments
-
-Format your response as a clean Markdown list designed for Telegram.
-Use this EXACT format:
-
-**TOP STORIES**
-• **Headline 1**: Brief summary (1-2 sentences). [1]
-• **Headline 2**: Brief summary. [2]
-
-**BUSINESS & FUNDING**
-• **Company**: Details of deal/funding ($Amount). [3]
-
-**MARKET TRENDS**
-• Trend or data point. [4]
-
-**QUICK HITS**
-• Brief item. [5]
-
-**Rules:**
-- Use "• " (bullet point + space) for every item.
-- **Bold** the company name or main subject at the start of each bullet.
-- ALWAYS end each bullet with the article number in brackets like [1], [2], etc.
-- Leave an empty line between sections.
-- Keep it concise and scannable. Avoid long paragraphs.
-
----
-ARTICLES:
-{article_text}
-"""
+    # Use GeminiCLI wrapper
+    gemini = gemini or GeminiCLI.get_instance()
     
     try:
         # fast mode (use_mcp=False) since we just need text summarization, no tools
-        response = await gemini.send_message(prompt, use_mcp=False)
+        complete = True
+        linked = None
+        inline_urls = len(articles) <= INLINE_URL_THRESHOLD
+        if len(articles) > _SHARD_SIZE:
+            response, complete = await _summarize_shards(gemini, articles, links, on_progress)
+        elif on_progress:
+            response, linked = await _stream_summary(
+                gemini,
+                _build_summary_prompt(articles, inline_urls=inline_urls),
+                str if inline_urls else _ref_replacer(links),
+                on_progress
+            )
+        else:
+            # Requests that pile up behind a running call share the next one
+            response = await _batcher.submit(
+                gemini, _build_summary_prompt(articles, inline_urls=inline_urls)
+            )
         
-        # Post-process: replace [1], [2], etc. with clickable [→](url) links
-        response = _replace_refs_with_links(response, articles)
+        # Partial (some shards failed) summaries are shown but not cached
+        if complete and response != _NO_RESPONSE:
+            _store_summary(cache_key, links, response, inline_urls)
         
-        return response
+        # Post-process: replace [1], [2], etc. with clickable [→](url) links
+        # (a streamed summary was already relinked as it arrived, and
+        # inline-URL summaries are linked by Gemini)
+        if linked is not None:
+            return linked
+        if inline_urls:
+            return response
+        return _replace_refs_with_links(response, links)
         
     except Exception as e:
         logger.error(f"Gemini summarization error: {e}")
         # Fallback: just list the top headlines with links
-        fallback = "⚠️ *Could not generate AI summary. Top headlines:*\n\n"
-        for a in articles[:10]:
-            fallback += f"• **{a.title}** [→]({a.link})\n"
-        return fallback
+        body = "".join("• **%s** [→](%s)\n" % (a.title, a.link) for a in articles[:10])
+        return "⚠️ *Could not generate AI summary. Top headlines:*\n\n" + body
@@ -3,11 +3,14 @@
 Provides commands for managing tasks via Telegram.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+import asyncio
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple
 import re
 
 from telegram import Update
+from telegram.helpers import escape_markdown
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -17,23 +20,74 @@ from telegram.ext import (
     filters
 )
 
-import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from src.automations.base import BaseAutomation
 from src.automations.tasks.manager import TaskManager, Task
 from src.automations.tasks.scheduler import TaskScheduler
 from src.automations.tasks.parser import (
     looks_like_task,
-    get_task_extraction_prompt,
-    parse_gemini_response,
+    maybe_extract_tasks,
     parse_due_date
 )
 from src.bot.security import authorized_only
+from src.gemini.cli_wrapper import GeminiCLI
 from src.utils.logger import logger
 from config.settings import settings
 
+# Weekday names -> weekday number
+_WEEKDAYS = {
+    day: i
+    for i, day in enumerate(
+        ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+    )
+}
+
+# Patterns for due dates and times, compiled once at import.
+# _NL_RE recognizes every natural-language form in one fullmatch:
+# "tomorrow [time]", "in N hours/minutes/days ..." and "<weekday>... [time]"
+_NL_RE = re.compile(
+    r'tomorrow(?: (?P<tomorrow_time>.*))?'
+    r'|in (?P<amount>\d+) (?P<unit>hour|minute|day).*'
+    r'|(?P<weekday>' + '|'.join(_WEEKDAYS) + r')[^ ]*(?: (?P<weekday_time>.*))?',
+    re.DOTALL
+)
+_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?')
+
+# Static command replies
+_TASK_HELP_TEXT = (
+    "📝 *Add a Task*\n\n"
+    "Usage: `/task <description> [due:<date>]`\n\n"
+    "*Examples:*\n"
+    "• `/task Buy groceries`\n"
+    "• `/task Finish report due:friday`\n"
+    "• `/task Call mom due:tomorrow 8pm`\n"
+    "• `/task Meeting due:2026-01-30 14:00`\n\n"
+    "*Date formats:*\n"
+    "• `tomorrow`, `friday`, `monday 3pm`\n"
+    "• `in 2 hours`, `in 3 days`\n"
+    "• `2026-01-30 14:00`\n\n"
+    "*Reminders:*\n"
+    "• Daily digest at 7 AM\n"
+    "• 1 hour before deadline"
+)
+
+_EMPTY_TASKS_TEXT = (
+    "📋 *No tasks*\n\n"
+    "Your task list is empty! Add one with:\n"
+    "`/task Buy groceries`"
+)
+
+_DONE_HELP_TEXT = (
+    "Usage: `/done <task_id>`\n"
+    "Example: `/done 3`"
+)
+
+_DELTASK_HELP_TEXT = (
+    "Usage: `/deltask <task_id>`\n"
+    "Example: `/deltask 3`"
+)
+
 
 def parse_datetime(text: str) -> Optional[datetime]:
     """Parse a datetime from natural language.
@@ -48,69 +102,94 @@ def parse_datetime(text: str) -> Optional[datetime]:
     Args:
         text: Text to parse
         
+    Returns:
+        Parsed datetime or None
+    """
+    # Fast path: ISO timestamps skip the natural-language checks. Only
+    # tried for text starting with a digit, which no keyword does.
+    if text[:1].isdigit():
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    
+    # Relative results are computed from the current minute, so repeated
+    # due strings ("tomorrow 8pm") within that minute reuse the parse
+    return _parse_datetime_at(text, datetime.now().replace(second=0, microsecond=0))
+
+
+@lru_cache(maxsize=256)
+def _parse_datetime_at(text: str, now: datetime) -> Optional[datetime]:
+    """Parse a datetime from natural language relative to a given time.
+    
+    Args:
+        text: Text to parse
+        now: Reference time for relative expressions
+        
     Returns:
         Parsed datetime or None
     """
     text = text.lower().strip()
-    now = datetime.now()
     
-    # Relative times
-    if text == "tomorrow":
-        return now.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    if text[:1].isdigit():
+        return _parse_numeric(text)
     
-    if text.startswith("tomorrow "):
-        time_part = text[9:].strip()
-        base = now + timedelta(days=1)
-        return _parse_time_into_date(base, time_part)
-    
-    if text.startswith("in "):
-        match = re.match(r'in (\d+) (hour|hours|minute|minutes|day|days)', text)
-        if match:
-            amount = int(match.group(1))
-            unit = match.group(2)
-            if 'hour' in unit:
-                return now + timedelta(hours=amount)
-            elif 'minute' in unit:
-                return now + timedelta(minutes=amount)
-            elif 'day' in unit:
-                return now + timedelta(days=amount)
+    match = _NL_RE.fullmatch(text)
+    if match is None:
+        return None
     
     # Day names
-    days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    for i, day in enumerate(days):
-        if text.startswith(day):
-            days_ahead = i - now.weekday()
-            if days_ahead <= 0:
-                days_ahead += 7
-            target = now + timedelta(days=days_ahead)
-            target = target.replace(hour=9, minute=0, second=0, microsecond=0)
-            
-            # Check for time
-            if ' ' in text:
-                time_part = text.split(' ', 1)[1]
-                return _parse_time_into_date(target, time_part)
-            return target
+    weekday = match['weekday']
+    if weekday:
+        days_ahead = _WEEKDAYS[weekday] - now.weekday()
+        if days_ahead <= 0:
+            days_ahead += 7
+        target = now + timedelta(days=days_ahead)
+        target = target.replace(hour=9, minute=0, second=0, microsecond=0)
+        
+        # Check for time
+        if match['weekday_time'] is not None:
+            return _parse_time_into_date(target, match['weekday_time'])
+        return target
     
-    # ISO format
+    # Relative times
+    amount = match['amount']
+    if amount:
+        unit = match['unit']
+        if unit == 'hour':
+            return now + timedelta(hours=int(amount))
+        elif unit == 'minute':
+            return now + timedelta(minutes=int(amount))
+        return now + timedelta(days=int(amount))
+    
+    if match['tomorrow_time'] is not None:
+        base = now + timedelta(days=1)
+        return _parse_time_into_date(base, match['tomorrow_time'])
+    return now.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+# Absolute date formats tried after ISO, keyed by (date separator, has time).
+# Only one format can match a given text, so it is picked up front.
+_DATE_FORMATS = {
+    ('-', True): "%Y-%m-%d %H:%M",
+    ('-', False): "%Y-%m-%d",
+    ('/', True): "%d/%m/%Y %H:%M",
+    ('/', False): "%d/%m/%Y",
+}
+
+
+def _parse_numeric(text: str) -> Optional[datetime]:
+    """Parse an ISO timestamp or one of the numeric date formats."""
     try:
         return datetime.fromisoformat(text)
     except ValueError:
         pass
     
-    # Date formats
-    formats = [
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d",
-        "%d/%m/%Y %H:%M",
-        "%d/%m/%Y",
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(text, fmt)
-        except ValueError:
-            continue
-    
-    return None
+    fmt = _DATE_FORMATS['/' if '/' in text else '-', ':' in text]
+    try:
+        return datetime.strptime(text, fmt)
+    except ValueError:
+        return None
 
 
 def _parse_time_into_date(base: datetime, time_str: str) -> datetime:
@@ -118,7 +197,7 @@ def _parse_time_into_date(base: datetime, time_str: str) -> datetime:
     time_str = time_str.lower().strip()
     
     # 12-hour format with am/pm
-    match = re.match(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', time_str)
+    match = _TIME_RE.match(time_str)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2)) if match.group(2) else 0
@@ -134,6 +213,109 @@ def _parse_time_into_date(base: datetime, time_str: str) -> datetime:
     return base
 
 
+def _find_due(text: str) -> Optional[Tuple[int, int]]:
+    """Locate a "due:<date> [time]" argument with a plain string scan.
+    
+    Matches the first case-insensitive "due:" followed by a non-space token,
+    plus an optional whitespace-separated time such as "8pm" or "14:30".
+    
+    Args:
+        text: Command arguments
+        
+    Returns:
+        (start, end) of the whole "due:..." span, or None. The date text
+        is text[start + 4:end].
+    """
+    n = len(text)
+    i = text.find(':', 3)
+    while i != -1:
+        if text[i - 3:i].lower() == 'due' and i + 1 < n and not text[i + 1].isspace():
+            break
+        i = text.find(':', i + 1)
+    else:
+        return None
+    
+    # Date token: everything up to the next whitespace
+    end = i + 1
+    while end < n and not text[end].isspace():
+        end += 1
+    
+    # Optional time: whitespace, 1-2 digits, optional ":MM", optional am/pm
+    j = end
+    while j < n and text[j].isspace():
+        j += 1
+    k = j
+    while k < n and k - j < 2 and text[k].isdecimal():
+        k += 1
+    if j > end and k > j:
+        if text[k:k + 1] == ':' and len(text[k + 1:k + 3]) == 2 and text[k + 1:k + 3].isdecimal():
+            k += 3
+        if text[k:k + 2].lower() in ('am', 'pm'):
+            k += 2
+        end = k
+    
+    return i - 3, end
+
+
+def _format_due(due_at: datetime, today: date) -> Tuple[str, bool]:
+    """Format the due-date suffix of a daily digest line.
+    
+    Args:
+        due_at: Task due date (not overdue)
+        today: Today's date
+        
+    Returns:
+        Tuple of (suffix, whether the task is due today)
+    """
+    if due_at.date() == today:
+        return f" (due today {due_at:%H:%M})", True
+    return f" (due {due_at:%m/%d})", False
+
+
+def _build_digest_text(tasks: List[Task], now: datetime) -> str:
+    """Render the daily digest message.
+    
+    Args:
+        tasks: Pending tasks to list
+        now: Current time (for overdue and due-today checks)
+        
+    Returns:
+        Markdown message text
+    """
+    task_lines = []
+    overdue_count = 0
+    due_today_count = 0
+    today = now.date()
+    
+    for task in tasks:
+        due_at = task.due_at
+        suffix = ""
+        if due_at:
+            # Tasks here are all pending, so overdue is just a past due date
+            if now > due_at:
+                suffix = " ⚠️ *OVERDUE*"
+                overdue_count += 1
+            else:
+                suffix, due_today = _format_due(due_at, today)
+                due_today_count += due_today
+        
+        # Descriptions are user text; escape them so a stray '_' or '*'
+        # can't break the message's formatting
+        task_lines.append(f"  `{task.id}.` {escape_markdown(task.description)}{suffix}")
+    
+    parts = ["☀️ *Good Morning! Daily Task Summary*\n\n"]
+    
+    if overdue_count > 0:
+        parts.append(f"⚠️ {overdue_count} overdue task(s)!\n")
+    if due_today_count > 0:
+        parts.append(f"📅 {due_today_count} task(s) due today\n")
+    
+    parts.append(f"\n*{len(tasks)} Pending Task(s):*\n")
+    parts.append("\n".join(task_lines))
+    parts.append("\n\n_Use /done <id> to complete a task._")
+    return "".join(parts)
+
+
 class TasksAutomation(BaseAutomation):
     """Task management automation with reminders."""
     
@@ -168,6 +350,13 @@ class TasksAutomation(BaseAutomation):
         
         # Store bot reference for sending messages
         self._bot = None
+        
+        # Recipients of digests and reminders (snapshot; see refresh_allowed_users)
+        self._allowed_user_ids = tuple(settings.ALLOWED_USER_IDS)
+    
+    def refresh_allowed_users(self) -> None:
+        """Re-read the authorized user IDs from settings."""
+        self._allowed_user_ids = tuple(settings.ALLOWED_USER_IDS)
     
     def register_handlers(self) -> None:
         """Register task-related command handlers."""
@@ -210,36 +399,43 @@ class TasksAutomation(BaseAutomation):
         """
         return looks_like_task(message)
     
-    def get_extraction_prompt(self, message: str) -> str:
-        """Get the prompt to send to Gemini for task extraction.
+    async def extract_tasks(
+        self,
+        message: str,
+        gemini: GeminiCLI,
+        on_match: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Extract tasks from a natural language message with Gemini.
+        
+        Messages that don't look like task requests are rejected without
+        calling Gemini.
         
         Args:
-            message: The user's natural language task request
+            message: The user's message
+            gemini: GeminiCLI instance to use
+            on_match: Optional callback awaited before Gemini is called
             
         Returns:
-            Prompt string for Gemini
+            List of parsed task dicts, or None if there is no task to create
         """
-        return get_task_extraction_prompt(message)
+        return await maybe_extract_tasks(message, gemini, on_match)
     
     async def create_task_from_parsed(
         self,
-        gemini_response: str,
+        parsed_tasks: List[Dict[str, Any]],
         update: 'Update'
     ) -> bool:
-        """Create task(s) from Gemini's parsed response.
+        """Create task(s) from tasks extracted by extract_tasks().
         
         Supports creating multiple tasks from a single message.
         
         Args:
-            gemini_response: Gemini's JSON response
+            parsed_tasks: Parsed task dicts (description, due_date)
             update: Telegram update for sending confirmation
             
         Returns:
             True if at least one task was created successfully
         """
-        # Parse Gemini's response (now returns a list)
-        parsed_tasks = parse_gemini_response(gemini_response)
-        
         if not parsed_tasks:
             return False
         
@@ -275,15 +471,16 @@ class TasksAutomation(BaseAutomation):
             response += f"\n\n_Task #{task.id} • Daily digest at 7 AM_"
         else:
             # Multiple tasks - summary format
-            response = f"✅ *{len(created_tasks)} Tasks Added!*\n\n"
+            parts = [f"✅ *{len(created_tasks)} Tasks Added!*\n\n"]
             
             for task in created_tasks:
                 due_str = ""
                 if task.due_at:
                     due_str = f" _(due {task.due_at.strftime('%a %m/%d %H:%M')})_"
-                response += f"📝 `#{task.id}` {task.description}{due_str}\n"
+                parts.append(f"📝 `#{task.id}` {task.description}{due_str}\n")
             
-            response += f"\n_Daily digest at 7 AM • Reminders 1h before deadlines_"
+            parts.append("\n_Daily digest at 7 AM • Reminders 1h before deadlines_")
+            response = "".join(parts)
         
         await update.message.reply_text(response, parse_mode='Markdown')
         return True
@@ -293,50 +490,8 @@ class TasksAutomation(BaseAutomation):
         if not self._bot or not tasks:
             return
         
-        # Build task list
-        task_lines = []
-        overdue_count = 0
-        due_today_count = 0
-        
-        for task in tasks:
-            line = f"  `{task.id}.` {task.description}"
-            
-            if task.due_at:
-                if task.is_overdue():
-                    line += " ⚠️ *OVERDUE*"
-                    overdue_count += 1
-                elif task.due_at.date() == datetime.now().date():
-                    line += f" (due today {task.due_at.strftime('%H:%M')})"
-                    due_today_count += 1
-                else:
-                    line += f" (due {task.due_at.strftime('%m/%d')})"
-            
-            task_lines.append(line)
-        
-        # Build message
-        header = "☀️ *Good Morning! Daily Task Summary*\n\n"
-        
-        if overdue_count > 0:
-            header += f"⚠️ {overdue_count} overdue task(s)!\n"
-        if due_today_count > 0:
-            header += f"📅 {due_today_count} task(s) due today\n"
-        
-        header += f"\n*{len(tasks)} Pending Task(s):*\n"
-        
-        message = header + "\n".join(task_lines)
-        message += "\n\n_Use /done <id> to complete a task._"
-        
-        # Send to all authorized users
-        for user_id in settings.ALLOWED_USER_IDS:
-            try:
-                await self._bot.send_message(
-                    chat_id=user_id,
-                    text=message,
-                    parse_mode='Markdown'
-                )
-                logger.info(f"Sent daily digest to user {user_id}")
-            except Exception as e:
-                logger.error(f"Failed to send daily digest to {user_id}: {e}")
+        # Rendered once and shared by every recipient
+        await self._send_to_all_users(_build_digest_text(tasks, datetime.now()), "daily digest")
     
     async def _send_deadline_reminder(self, task: Task) -> None:
         """Send a reminder 1 hour before task deadline."""
@@ -352,23 +507,34 @@ class TasksAutomation(BaseAutomation):
         
         message = (
             f"⏰ *Deadline Approaching!*\n\n"
-            f"📝 {task.description}\n"
+            f"📝 {escape_markdown(task.description)}\n"
             f"⏱️ Due in {time_str}\n"
             f"📅 {task.due_at.strftime('%Y-%m-%d %H:%M')}\n\n"
             f"Reply `/done {task.id}` when complete."
         )
         
-        # Send to all authorized users
-        for user_id in settings.ALLOWED_USER_IDS:
-            try:
-                await self._bot.send_message(
-                    chat_id=user_id,
-                    text=message,
-                    parse_mode='Markdown'
-                )
-                logger.info(f"Sent deadline reminder for task #{task.id} to user {user_id}")
-            except Exception as e:
-                logger.error(f"Failed to send deadline reminder to {user_id}: {e}")
+        await self._send_to_all_users(message, f"deadline reminder for task #{task.id}")
+    
+    async def _send_to_all_users(self, message: str, what: str) -> None:
+        """Send a message to all authorized users concurrently.
+        
+        Args:
+            message: Markdown message text
+            what: Description of the message for logging
+        """
+        user_ids = self._allowed_user_ids
+        results = await asyncio.gather(
+            *(
+                self._bot.send_message(chat_id=user_id, text=message, parse_mode='Markdown')
+                for user_id in user_ids
+            ),
+            return_exceptions=True
+        )
+        for user_id, result in zip(user_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send {what} to {user_id}: {result}")
+            else:
+                logger.info(f"Sent {what} to user {user_id}")
     
     @authorized_only
     async def _add_task_command(
@@ -385,23 +551,7 @@ class TasksAutomation(BaseAutomation):
             /task Call mom due:tomorrow 8pm
         """
         if not context.args:
-            await update.message.reply_text(
-                "📝 *Add a Task*\n\n"
-                "Usage: `/task <description> [due:<date>]`\n\n"
-                "*Examples:*\n"
-                "• `/task Buy groceries`\n"
-                "• `/task Finish report due:friday`\n"
-                "• `/task Call mom due:tomorrow 8pm`\n"
-                "• `/task Meeting due:2026-01-30 14:00`\n\n"
-                "*Date formats:*\n"
-                "• `tomorrow`, `friday`, `monday 3pm`\n"
-                "• `in 2 hours`, `in 3 days`\n"
-                "• `2026-01-30 14:00`\n\n"
-                "*Reminders:*\n"
-                "• Daily digest at 7 AM\n"
-                "• 1 hour before deadline",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_TASK_HELP_TEXT, parse_mode='Markdown')
             return
         
         # Parse the command
@@ -409,11 +559,13 @@ class TasksAutomation(BaseAutomation):
         
         # Extract due date
         due_at = None
-        due_match = re.search(r'due:(\S+(?:\s+\d{1,2}(?::\d{2})?(?:am|pm)?)?)', text, re.IGNORECASE)
-        if due_match:
-            due_str = due_match.group(1)
-            due_at = parse_datetime(due_str)
-            text = text[:due_match.start()] + text[due_match.end():]
+        due_span = _find_due(text)
+        if due_span:
+            start, end = due_span
+            due_str = text[start + 4:end]
+            # Numeric dates ("2026-01-30 14:00") skip the natural-language parser
+            due_at = _parse_numeric(due_str) if due_str[0].isdigit() else parse_datetime(due_str)
+            text = text[:start] + text[end:]
         
         # Clean up description
         description = ' '.join(text.split()).strip()
@@ -454,41 +606,38 @@ class TasksAutomation(BaseAutomation):
         tasks = self.task_manager.get_all_tasks(include_completed=include_completed)
         
         if not tasks:
-            await update.message.reply_text(
-                "📋 *No tasks*\n\n"
-                "Your task list is empty! Add one with:\n"
-                "`/task Buy groceries`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_EMPTY_TASKS_TEXT, parse_mode='Markdown')
             return
         
-        # Group tasks by status
-        pending = [t for t in tasks if t.status == 'pending']
-        completed = [t for t in tasks if t.status == 'completed']
+        # Group tasks by status (single pass)
+        pending, completed = [], []
+        for t in tasks:
+            if t.status == 'pending':
+                pending.append(t)
+            elif t.status == 'completed':
+                completed.append(t)
         
-        response = "📋 *Your Tasks*\n\n"
+        parts = ["📋 *Your Tasks*\n\n"]
         
         if pending:
-            response += "*Pending:*\n"
+            parts.append("*Pending:*\n")
             for task in pending:
-                due_str = ""
-                if task.due_at:
-                    due_str = f" (due: {task.due_at.strftime('%m/%d')})"
-                response += f"  `{task.id}.` {task.description}{due_str}\n"
+                due_at = task.due_at
+                due_str = f" (due: {due_at:%m/%d})" if due_at else ""
+                parts.append(f"  `{task.id}.` {task.description}{due_str}\n")
         
         if completed and include_completed:
-            response += "\n*Completed:*\n"
-            for task in completed:
-                response += f"  ✓ ~~{task.description}~~\n"
+            parts.append("\n*Completed:*\n")
+            parts.extend(f"  ✓ ~~{task.description}~~\n" for task in completed)
         
-        response += f"\n_Total: {len(pending)} pending"
+        parts.append(f"\n_Total: {len(pending)} pending")
         if include_completed:
-            response += f", {len(completed)} completed"
-        response += "_"
+            parts.append(f", {len(completed)} completed")
+        parts.append("_")
         
-        response += "\n\nUse `/done <id>` to complete a task."
+        parts.append("\n\nUse `/done <id>` to complete a task.")
         
-        await update.message.reply_text(response, parse_mode='Markdown')
+        await update.message.reply_text("".join(parts), parse_mode='Markdown')
     
     @authorized_only
     async def _complete_task_command(
@@ -498,11 +647,7 @@ class TasksAutomation(BaseAutomation):
     ) -> None:
         """Handle /done command to mark a task as complete."""
         if not context.args:
-            await update.message.reply_text(
-                "Usage: `/done <task_id>`\n"
-                "Example: `/done 3`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_DONE_HELP_TEXT, parse_mode='Markdown')
             return
         
         try:
@@ -531,11 +676,7 @@ class TasksAutomation(BaseAutomation):
     ) -> None:
         """Handle /deltask command to delete a task."""
         if not context.args:
-            await update.message.reply_text(
-                "Usage: `/deltask <task_id>`\n"
-                "Example: `/deltask 3`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_DELTASK_HELP_TEXT, parse_mode='Markdown')
             return
         
         try:
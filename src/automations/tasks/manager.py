@@ -4,20 +4,34 @@ Handles reading, writing, and managing tasks in a JSON file.
 """
 
 import json
+import os
+from bisect import bisect_left, bisect_right
+from copy import copy
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 import threading
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
+from src.utils import json_io
 from src.utils.logger import logger
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso(text: str) -> datetime:
+    """Parse an ISO timestamp, cached since every reload sees the same strings."""
+    return datetime.fromisoformat(text)
+
+
 class Task:
     """Represents a single task."""
     
+    # Fixed attribute layout: no per-instance __dict__ for every cached task
+    __slots__ = (
+        'id', 'description', 'created_at', 'due_at', 'status',
+        'deadline_reminder_sent', 'notes', '_created_iso', '_due_iso'
+    )
+    
     def __init__(
         self,
         id: int,
@@ -35,14 +49,29 @@ class Task:
         self.status = status  # pending, completed, cancelled
         self.deadline_reminder_sent = deadline_reminder_sent  # True if 1-hour-before reminder sent
         self.notes = notes
+        
+        # isoformat() strings memoized by to_dict, with the datetimes they were built from
+        self._created_iso: Optional[Tuple[datetime, str]] = None
+        self._due_iso: Optional[Tuple[datetime, str]] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert task to dictionary for JSON serialization."""
+        """Convert task to dictionary for JSON serialization.
+        
+        Timestamps are formatted once and reused until the attribute is
+        reassigned, so saving an unchanged task does no date formatting.
+        """
+        created_at = self.created_at
+        if created_at and (self._created_iso is None or self._created_iso[0] is not created_at):
+            self._created_iso = (created_at, created_at.isoformat())
+        due_at = self.due_at
+        if due_at and (self._due_iso is None or self._due_iso[0] is not due_at):
+            self._due_iso = (due_at, due_at.isoformat())
+        
         return {
             "id": self.id,
             "description": self.description,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "due_at": self.due_at.isoformat() if self.due_at else None,
+            "created_at": self._created_iso[1] if created_at else None,
+            "due_at": self._due_iso[1] if due_at else None,
             "status": self.status,
             "deadline_reminder_sent": self.deadline_reminder_sent,
             "notes": self.notes
@@ -54,8 +83,8 @@ class Task:
         return cls(
             id=data["id"],
             description=data["description"],
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(),
-            due_at=datetime.fromisoformat(data["due_at"]) if data.get("due_at") else None,
+            created_at=_parse_iso(data["created_at"]) if data.get("created_at") else datetime.now(),
+            due_at=_parse_iso(data["due_at"]) if data.get("due_at") else None,
             status=data.get("status", "pending"),
             deadline_reminder_sent=data.get("deadline_reminder_sent", False),
             notes=data.get("notes", "")
@@ -65,17 +94,25 @@ class Task:
         """Check if task is still pending."""
         return self.status == "pending"
     
-    def is_overdue(self) -> bool:
-        """Check if task is past its due date."""
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """Check if task is past its due date.
+        
+        Args:
+            now: Current time, if the caller already has it (defaults to now)
+        """
         if not self.due_at:
             return False
-        return datetime.now() > self.due_at and self.is_pending()
+        return (now or datetime.now()) > self.due_at and self.is_pending()
     
-    def time_until_due(self) -> Optional[timedelta]:
-        """Get time remaining until due date."""
+    def time_until_due(self, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """Get time remaining until due date.
+        
+        Args:
+            now: Current time, if the caller already has it (defaults to now)
+        """
         if not self.due_at:
             return None
-        return self.due_at - datetime.now()
+        return self.due_at - (now or datetime.now())
 
 
 class TaskManager:
@@ -89,6 +126,24 @@ class TaskManager:
         """
         self.data_file = Path(data_file)
         self._lock = threading.Lock()
+        
+        # Parsed tasks and the file mtime (ns) they were read at. The tuple and
+        # the Tasks in it are never modified: writers save a new list holding
+        # updated copies and only then publish it, so lock-free readers never
+        # see half-applied or unsaved changes.
+        self._cache: Optional[Tuple[Task, ...]] = None
+        self._cache_mtime: Optional[int] = None
+        
+        # Lookup index over the cached tasks, and the id the next task gets
+        self._by_id: Dict[int, Task] = {}
+        self._next_id = 1
+        
+        # (cache, due dates, tasks) for the cache's pending tasks with a due
+        # date, sorted by due date; rebuilt lazily when the cache changes
+        self._due_index: Tuple[Tuple[Task, ...], List[datetime], List[Task]] = ((), [], [])
+        
+        # Called after a save that may move a deadline earlier (add/update)
+        self.on_change: Optional[Callable[[], None]] = None
         self._ensure_file_exists()
     
     def _ensure_file_exists(self) -> None:
@@ -98,11 +153,52 @@ class TaskManager:
             self._save_tasks([])
             logger.info(f"Created task file at {self.data_file}")
     
-    def _load_tasks(self) -> List[Task]:
-        """Load all tasks from the JSON file."""
+    def _file_mtime(self) -> Optional[int]:
+        """Get the data file's modification time, or None if it can't be read."""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            return self.data_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _load_tasks(self) -> Tuple[Task, ...]:
+        """Load all tasks, reusing the cached tuple unless the file changed.
+        
+        Callers hold ``self._lock``. The result must not be modified; to
+        change tasks, pass a new list with updated copies to ``_save_tasks``.
+        """
+        mtime = self._file_mtime()
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+        
+        self._set_cache(self._read_tasks(), mtime)
+        return self._cache
+    
+    def _set_cache(self, tasks: List[Task], mtime: Optional[int]) -> None:
+        """Publish a task list as the cache and rebuild its id index."""
+        self._by_id = {task.id: task for task in tasks}
+        self._next_id = max(self._by_id, default=0) + 1
+        self._cache = tuple(tasks)
+        # Set last: a matching mtime is what lets readers skip the lock
+        self._cache_mtime = mtime
+    
+    def _read_snapshot(self) -> Tuple[Task, ...]:
+        """Get all tasks for read-only queries.
+        
+        No lock is taken while the cache matches the file: writers publish
+        the new cache before recording the file's new mtime, so a reader
+        that sees a matching mtime (read first) also sees the current cache.
+        """
+        cached_mtime = self._cache_mtime
+        cache = self._cache
+        if cache is not None and self._file_mtime() == cached_mtime:
+            return cache
+        with self._lock:
+            return self._load_tasks()
+    
+    def _read_tasks(self) -> List[Task]:
+        """Read and parse all tasks from the JSON file."""
+        try:
+            data = json_io.loads(self.data_file.read_bytes())
             
             tasks = []
             for task_data in data.get("tasks", []):
@@ -120,26 +216,59 @@ class TaskManager:
             return []
     
     def _save_tasks(self, tasks: List[Task]) -> bool:
-        """Save all tasks to the JSON file."""
+        """Save all tasks to the JSON file and, once written, publish them as the cache."""
         try:
             data = {
                 "tasks": [task.to_dict() for task in tasks],
                 "last_updated": datetime.now().isoformat()
             }
             
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in, so a crash can't truncate the tasks
+            tmp_file = self.data_file.with_suffix('.tmp')
+            tmp_file.write_bytes(json_io.dumps(data))
+            os.replace(tmp_file, self.data_file)
             
+            self._set_cache(tasks, self._file_mtime())
             return True
         except Exception as e:
             logger.error(f"Failed to save tasks: {e}")
             return False
     
-    def _get_next_id(self, tasks: List[Task]) -> int:
-        """Get the next available task ID."""
-        if not tasks:
-            return 1
-        return max(task.id for task in tasks) + 1
+    def _save_replacing(self, tasks: Tuple[Task, ...], replacements: Dict[Task, Task]) -> bool:
+        """Save the tasks with some of them swapped for updated copies.
+        
+        Args:
+            tasks: The current cache
+            replacements: Updated copy for each cached Task being changed
+            
+        Returns:
+            True if saved (the copies are then the published tasks)
+        """
+        return self._save_tasks([replacements.get(t, t) for t in tasks])
+    
+    def _notify_change(self) -> None:
+        """Tell the listener (the reminder scheduler) that tasks changed."""
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                logger.error(f"Task change callback failed: {e}")
+    
+    def _due_sorted(self) -> Tuple[List[datetime], List[Task]]:
+        """Get pending tasks with a due date, sorted by due date.
+        
+        Returns:
+            Tuple of (due dates, tasks) in matching order, for bisecting
+        """
+        cache = self._read_snapshot()
+        index = self._due_index
+        if index[0] is not cache:
+            tasks = sorted(
+                (t for t in cache if t.due_at and t.is_pending()),
+                key=lambda t: t.due_at
+            )
+            index = self._due_index = (cache, [t.due_at for t in tasks], tasks)
+        return index[1], index[2]
     
     def add_task(
         self,
@@ -161,28 +290,23 @@ class TaskManager:
             tasks = self._load_tasks()
             
             task = Task(
-                id=self._get_next_id(tasks),
+                id=self._next_id,
                 description=description,
                 created_at=datetime.now(),
                 due_at=due_at,
                 notes=notes
             )
             
-            tasks.append(task)
-            
-            if self._save_tasks(tasks):
+            if self._save_tasks([*tasks, task]):
                 logger.info(f"Added task #{task.id}: {description[:50]}")
+                self._notify_change()
                 return task
             return None
     
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get a task by ID."""
-        with self._lock:
-            tasks = self._load_tasks()
-            for task in tasks:
-                if task.id == task_id:
-                    return task
-            return None
+        self._read_snapshot()
+        return self._by_id.get(task_id)
     
     def get_all_tasks(self, include_completed: bool = False) -> List[Task]:
         """Get all tasks.
@@ -193,34 +317,60 @@ class TaskManager:
         Returns:
             List of tasks
         """
-        with self._lock:
-            tasks = self._load_tasks()
-            
-            if include_completed:
-                return tasks
-            
-            return [t for t in tasks if t.is_pending()]
+        tasks = self._read_snapshot()
+        
+        if include_completed:
+            return list(tasks)
+        
+        return [t for t in tasks if t.is_pending()]
     
     def get_pending_tasks(self) -> List[Task]:
         """Get all pending tasks."""
         return self.get_all_tasks(include_completed=False)
     
-    def get_tasks_due_soon(self, hours: int = 24) -> List[Task]:
+    def get_tasks_due_soon(
+        self,
+        hours: int = 24,
+        unreminded_only: bool = False,
+        exclude_passed: bool = False,
+        now: Optional[datetime] = None
+    ) -> List[Task]:
         """Get all pending tasks due within the specified hours.
         
         Args:
             hours: Number of hours to look ahead
+            unreminded_only: Skip tasks whose deadline reminder was already sent
+            exclude_passed: Skip tasks whose deadline has already passed
+            now: Current time, if the caller already has it (defaults to now)
             
         Returns:
-            List of tasks due within the time window
+            List of tasks due within the time window, soonest first
         """
-        with self._lock:
-            tasks = self._load_tasks()
-            threshold = datetime.now() + timedelta(hours=hours)
-            return [
-                t for t in tasks 
-                if t.is_pending() and t.due_at and t.due_at <= threshold
-            ]
+        now = now or datetime.now()
+        due_dates, tasks = self._due_sorted()
+        start = bisect_left(due_dates, now) if exclude_passed else 0
+        end = bisect_right(due_dates, now + timedelta(hours=hours))
+        return [
+            t for t in tasks[start:end]
+            if t.is_pending() and not (unreminded_only and t.deadline_reminder_sent)
+        ]
+    
+    def get_next_unreminded_due(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Get the earliest upcoming deadline whose reminder hasn't been sent.
+        
+        Args:
+            now: Current time, if the caller already has it (defaults to now)
+            
+        Returns:
+            The due date, or None if no pending task qualifies
+        """
+        now = now or datetime.now()
+        due_dates, tasks = self._due_sorted()
+        for i in range(bisect_left(due_dates, now), len(tasks)):
+            task = tasks[i]
+            if task.is_pending() and not task.deadline_reminder_sent:
+                return task.due_at
+        return None
     
     def complete_task(self, task_id: int) -> Optional[Task]:
         """Mark a task as completed.
@@ -233,15 +383,15 @@ class TaskManager:
         """
         with self._lock:
             tasks = self._load_tasks()
+            current = self._by_id.get(task_id)
+            if current is None:
+                return None
             
-            for task in tasks:
-                if task.id == task_id:
-                    task.status = "completed"
-                    if self._save_tasks(tasks):
-                        logger.info(f"Completed task #{task_id}")
-                        return task
-                    return None
-            
+            task = copy(current)
+            task.status = "completed"
+            if self._save_replacing(tasks, {current: task}):
+                logger.info(f"Completed task #{task_id}")
+                return task
             return None
     
     def update_task(
@@ -264,22 +414,23 @@ class TaskManager:
         """
         with self._lock:
             tasks = self._load_tasks()
+            current = self._by_id.get(task_id)
+            if current is None:
+                return None
             
-            for task in tasks:
-                if task.id == task_id:
-                    if description is not None:
-                        task.description = description
-                    if due_at is not None:
-                        task.due_at = due_at
-                        task.deadline_reminder_sent = False  # Reset reminder if due date changed
-                    if notes is not None:
-                        task.notes = notes
-                    
-                    if self._save_tasks(tasks):
-                        logger.info(f"Updated task #{task_id}")
-                        return task
-                    return None
+            task = copy(current)
+            if description is not None:
+                task.description = description
+            if due_at is not None:
+                task.due_at = due_at
+                task.deadline_reminder_sent = False  # Reset reminder if due date changed
+            if notes is not None:
+                task.notes = notes
             
+            if self._save_replacing(tasks, {current: task}):
+                logger.info(f"Updated task #{task_id}")
+                self._notify_change()
+                return task
             return None
     
     def mark_deadline_reminded(self, task_id: int) -> bool:
@@ -293,13 +444,35 @@ class TaskManager:
         """
         with self._lock:
             tasks = self._load_tasks()
+            current = self._by_id.get(task_id)
+            if current is None:
+                return False
+            
+            task = copy(current)
+            task.deadline_reminder_sent = True
+            return self._save_replacing(tasks, {current: task})
+    
+    def mark_deadline_reminded_bulk(self, task_ids: Iterable[int]) -> int:
+        """Mark several tasks' deadline reminders as sent with a single save.
+        
+        Args:
+            task_ids: IDs of the tasks
             
-            for task in tasks:
-                if task.id == task_id:
+        Returns:
+            Number of tasks marked (unknown IDs are skipped)
+        """
+        with self._lock:
+            tasks = self._load_tasks()
+            replacements = {}
+            for task_id in task_ids:
+                current = self._by_id.get(task_id)
+                if current is not None and current not in replacements:
+                    task = replacements[current] = copy(current)
                     task.deadline_reminder_sent = True
-                    return self._save_tasks(tasks)
             
-            return False
+            if replacements and not self._save_replacing(tasks, replacements):
+                return 0
+            return len(replacements)
     
     def delete_task(self, task_id: int) -> bool:
         """Delete a task.
@@ -312,14 +485,13 @@ class TaskManager:
         """
         with self._lock:
             tasks = self._load_tasks()
-            original_count = len(tasks)
+            task = self._by_id.get(task_id)
+            if task is None:
+                return False
             
-            tasks = [t for t in tasks if t.id != task_id]
-            
-            if len(tasks) < original_count:
-                if self._save_tasks(tasks):
-                    logger.info(f"Deleted task #{task_id}")
-                    return True
+            if self._save_tasks([t for t in tasks if t is not task]):
+                logger.info(f"Deleted task #{task_id}")
+                return True
             
             return False
     
@@ -327,17 +499,16 @@ class TaskManager:
         """Remove all completed tasks.
         
         Returns:
-            Number of tasks removed
+            Number of tasks removed (0 if the save failed)
         """
         with self._lock:
             tasks = self._load_tasks()
-            original_count = len(tasks)
-            
-            tasks = [t for t in tasks if t.is_pending()]
-            removed = original_count - len(tasks)
+            pending = [t for t in tasks if t.is_pending()]
+            removed = len(tasks) - len(pending)
             
             if removed > 0:
-                self._save_tasks(tasks)
+                if not self._save_tasks(pending):
+                    return 0
                 logger.info(f"Cleared {removed} completed tasks")
             
             return removed
@@ -2,17 +2,17 @@
 
 Uses Gemini to extract task details from conversational messages.
 Supports multiple tasks separated by semicolons or "and".
+
+Prefer maybe_extract_tasks as the entry point: it gates the Gemini round
+trip behind the cheap looks_like_task check.
 """
 
 import json
 import re
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Tuple, List
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from typing import Awaitable, Callable, Optional, Dict, Any, Tuple, List
 
+from src.gemini.cli_wrapper import GeminiCLI
 from src.utils.logger import logger
 
 
@@ -31,8 +31,14 @@ TASK_PHRASES = [
     r'\bset a reminder\b',
 ]
 
-# Compile patterns for efficiency
-TASK_PATTERNS = [re.compile(p, re.IGNORECASE) for p in TASK_PHRASES]
+# Literals at least one of which every phrase above contains (lowercase)
+_TASK_KEYWORDS = ('remind', 'remember', 'forget', 'task', 'todo', 'to-do', 'schedule')
+
+# All phrases as one alternation, so a message is scanned once
+_TASK_RE = re.compile('|'.join(f'(?:{p})' for p in TASK_PHRASES), re.IGNORECASE)
+
+# Body of a ``` fenced block (any language tag); an unclosed fence runs to the end
+_FENCE_RE = re.compile(r'^[ \t]*```[^\n]*\n(.*?)(?:^[ \t]*```|\Z)', re.DOTALL | re.MULTILINE)
 
 
 def looks_like_task(message: str) -> bool:
@@ -44,32 +50,22 @@ def looks_like_task(message: str) -> bool:
     Returns:
         True if the message appears to be a task request
     """
-    for pattern in TASK_PATTERNS:
-        if pattern.search(message):
-            return True
-    return False
+    # Cheap substring prefilter for the common non-task case. Only for ASCII
+    # text: IGNORECASE also folds letters like 'ſ' and 'İ' that lower() keeps.
+    if message.isascii():
+        lower = message.lower()
+        if not any(k in lower for k in _TASK_KEYWORDS):
+            return False
+    return _TASK_RE.search(message) is not None
 
 
-def get_task_extraction_prompt(message: str) -> str:
-    """Generate a prompt for Gemini to extract task details.
-    
-    Supports extracting multiple tasks from a single message.
-    Tasks can be separated by semicolons (;) or the word "and".
-    
-    Args:
-        message: The user's natural language task request
-        
-    Returns:
-        A prompt string for Gemini
-    """
-    current_time = datetime.now()
-    
-    return f"""Extract ALL task details from the following message. The message may contain MULTIPLE tasks separated by semicolons (;) or the word "and".
+# Task extraction prompt; only the clock and the message vary per call
+_EXTRACTION_PROMPT_TEMPLATE = """Extract ALL task details from the following message. The message may contain MULTIPLE tasks separated by semicolons (;) or the word "and".
 
 IMPORTANT: DO NOT use any tools, file operations, or external resources. This is a pure text parsing task.
 Return ONLY a JSON object with no additional text, no code, no explanations.
 
-Current date/time: {current_time.strftime('%Y-%m-%d %H:%M')} ({current_time.strftime('%A')})
+Current date/time: {current_time}
 
 Message: "{message}"
 
@@ -98,6 +94,24 @@ Examples:
 Return ONLY the JSON object, no markdown, no explanation:"""
 
 
+def get_task_extraction_prompt(message: str) -> str:
+    """Generate a prompt for Gemini to extract task details.
+    
+    Supports extracting multiple tasks from a single message.
+    Tasks can be separated by semicolons (;) or the word "and".
+    
+    Args:
+        message: The user's natural language task request
+        
+    Returns:
+        A prompt string for Gemini
+    """
+    return _EXTRACTION_PROMPT_TEMPLATE.format(
+        current_time=datetime.now().strftime('%Y-%m-%d %H:%M (%A)'),
+        message=message
+    )
+
+
 def _clean_json_response(response: str) -> str:
     """Clean up a response that may contain markdown or extra text.
     
@@ -109,21 +123,51 @@ def _clean_json_response(response: str) -> str:
     """
     response = response.strip()
     
-    # Remove markdown code blocks if present
-    if '```' in response:
-        lines = response.split('\n')
-        json_lines = []
-        in_block = False
-        for line in lines:
-            if line.strip().startswith('```'):
-                in_block = not in_block
-                continue
-            if in_block:
-                json_lines.append(line)
-        if json_lines:
-            response = '\n'.join(json_lines)
+    # Unwrap the first markdown code block if present
+    match = _FENCE_RE.search(response)
+    if match and match.group(1).strip():
+        return match.group(1).strip()
+    
+    return response
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """Find the first balanced {...} object in a response.
+    
+    Scans once, tracking brace depth and skipping braces inside JSON
+    strings, so malformed responses can't trigger regex backtracking.
+    
+    Args:
+        text: Response text that may contain a JSON object
+        
+    Returns:
+        The object's source text, or None if there is no balanced object
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
     
-    return response.strip()
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
 
 
 def parse_gemini_response(response: str) -> Optional[List[Dict[str, Any]]]:
@@ -174,15 +218,11 @@ def parse_gemini_response(response: str) -> Optional[List[Dict[str, Any]]]:
         
     except json.JSONDecodeError:
         # Try to extract JSON from mixed content
-        # First try to find object with "tasks" array
-        json_match = re.search(r'\{[^{}]*"tasks"\s*:\s*\[[^\]]*\][^{}]*\}', response, re.DOTALL)
-        if not json_match:
-            # Try simpler single-object pattern
-            json_match = re.search(r'\{[^{}]*\}', response)
+        json_text = _extract_json_object(response)
         
-        if json_match:
+        if json_text:
             try:
-                data = json.loads(json_match.group())
+                data = json.loads(json_text)
                 
                 # Try multi-task format
                 if 'tasks' in data and isinstance(data['tasks'], list):
@@ -213,6 +253,34 @@ def parse_gemini_response(response: str) -> Optional[List[Dict[str, Any]]]:
         return None
 
 
+async def maybe_extract_tasks(
+    message: str,
+    gemini: GeminiCLI,
+    on_match: Optional[Callable[[], Awaitable[None]]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """Extract tasks from a message, skipping Gemini for non-task messages.
+    
+    Args:
+        message: The user's message
+        gemini: GeminiCLI instance to use
+        on_match: Optional callback awaited once the message passes the
+            looks_like_task gate, before Gemini is called (e.g. to show typing)
+        
+    Returns:
+        List of parsed task dicts, or None if the message isn't a task request
+        or no task could be extracted
+    """
+    if not looks_like_task(message):
+        return None
+    
+    if on_match:
+        await on_match()
+    
+    # Pure text parsing, so skip MCP server startup
+    response = await gemini.send_message(get_task_extraction_prompt(message), use_mcp=False)
+    return parse_gemini_response(response)
+
+
 def parse_due_date(due_date_str: Optional[str]) -> Optional[datetime]:
     """Parse a due date string to datetime.
     
@@ -12,9 +12,7 @@ from datetime import datetime, timedelta, time
 from typing import Callable, Optional, Awaitable, List
 import asyncio
 
-import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from src.utils.logger import logger
 from src.automations.tasks.manager import TaskManager, Task
@@ -29,8 +27,15 @@ class TaskScheduler:
     Implements two types of reminders:
     1. Daily digest at a configured time (e.g., 7 AM)
     2. Individual reminders 1 hour before task deadlines
+    
+    Between checks the loop sleeps until the next digest or reminder is
+    due, and is woken early when a task is added or updated.
     """
     
+    # Longest single sleep, so the loop re-syncs with the wall clock
+    # (e.g. after the laptop wakes from suspend or tasks.json is edited by hand)
+    _MAX_SLEEP = 3600
+    
     def __init__(
         self,
         task_manager: TaskManager,
@@ -45,7 +50,7 @@ class TaskScheduler:
         
         Args:
             task_manager: TaskManager instance
-            check_interval: Seconds between reminder checks
+            check_interval: Seconds before retrying a digest or reminder that failed
             daily_digest_hour: Hour for daily digest (0-23, default 7 AM)
             daily_digest_minute: Minute for daily digest (0-59, default 0)
             hours_before_deadline: Hours before deadline to send reminder
@@ -62,6 +67,7 @@ class TaskScheduler:
         
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
         self._last_daily_digest_date: Optional[datetime] = self._load_last_digest_date()
     
     async def start(self) -> None:
@@ -70,6 +76,8 @@ class TaskScheduler:
             return
         
         self._running = True
+        loop = asyncio.get_running_loop()
+        self.task_manager.on_change = lambda: loop.call_soon_threadsafe(self._wakeup.set)
         self._task = asyncio.create_task(self._reminder_loop())
         logger.info(
             f"Task scheduler started - "
@@ -80,6 +88,7 @@ class TaskScheduler:
     async def stop(self) -> None:
         """Stop the reminder scheduler."""
         self._running = False
+        self.task_manager.on_change = None
         
         if self._task:
             self._task.cancel()
@@ -94,21 +103,69 @@ class TaskScheduler:
     async def _reminder_loop(self) -> None:
         """Main loop that checks for reminders."""
         while self._running:
+            # Cleared before the checks, so a change made during them wakes us again
+            self._wakeup.clear()
             try:
-                await self._check_daily_digest()
-                await self._check_deadline_reminders()
+                # One clock reading per tick, shared by both checks
+                now = datetime.now()
+                await self._check_daily_digest(now)
+                await self._check_deadline_reminders(now)
+                delay = self._seconds_until_next_check(datetime.now())
             except Exception as e:
                 logger.error(f"Error in reminder loop: {e}")
+                delay = self.check_interval
             
-            await asyncio.sleep(self.check_interval)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _seconds_until_next_check(self, now: datetime) -> float:
+        """Seconds until the next digest or deadline reminder is due.
+        
+        Anything already due at this point failed to send during the last
+        check, so it is retried after check_interval instead of immediately.
+        
+        Args:
+            now: Current time
+            
+        Returns:
+            Seconds to sleep, at most _MAX_SLEEP
+        """
+        events = []
+        
+        if self.on_daily_digest:
+            target_datetime = now.replace(
+                hour=self.daily_digest_hour,
+                minute=self.daily_digest_minute,
+                second=0,
+                microsecond=0
+            )
+            if self._last_daily_digest_date and self._last_daily_digest_date.date() == now.date():
+                target_datetime += timedelta(days=1)
+            events.append(target_datetime)
+        
+        if self.on_deadline_reminder:
+            # Deadlines that already passed never get a reminder
+            next_due = self.task_manager.get_next_unreminded_due(now)
+            if next_due:
+                events.append(next_due - timedelta(hours=self.hours_before_deadline))
+        
+        delay = self._MAX_SLEEP
+        for event in events:
+            seconds = (event - now).total_seconds()
+            delay = min(delay, seconds if seconds > 0 else self.check_interval)
+        return delay
     
-    async def _check_daily_digest(self) -> None:
-        """Check if it's time for the daily digest."""
+    async def _check_daily_digest(self, now: datetime) -> None:
+        """Check if it's time for the daily digest.
+        
+        Args:
+            now: Current time for this tick
+        """
         if not self.on_daily_digest:
             return
         
-        now = datetime.now()
-        
         # Already sent today?
         if self._last_daily_digest_date and self._last_daily_digest_date.date() == now.date():
             return
@@ -146,34 +203,35 @@ class TaskScheduler:
             self._last_daily_digest_date = now
             self._save_last_digest_date(now)
     
-    async def _check_deadline_reminders(self) -> None:
-        """Check for tasks approaching their deadline."""
+    async def _check_deadline_reminders(self, now: datetime) -> None:
+        """Check for tasks approaching their deadline.
+        
+        Args:
+            now: Current time for this tick
+        """
         if not self.on_deadline_reminder:
             return
         
-        now = datetime.now()
-        reminder_threshold = now + timedelta(hours=self.hours_before_deadline)
+        # Within the reminder window, not yet reminded, and not already past due
+        due_soon = self.task_manager.get_tasks_due_soon(
+            hours=self.hours_before_deadline,
+            unreminded_only=True,
+            exclude_passed=True,
+            now=now
+        )
         
-        # Get all pending tasks
-        pending_tasks = self.task_manager.get_pending_tasks()
+        sent_ids = []
+        for task in due_soon:
+            try:
+                await self.on_deadline_reminder(task)
+                sent_ids.append(task.id)
+                logger.info(f"Sent deadline reminder for task #{task.id}")
+            except Exception as e:
+                logger.error(f"Error sending deadline reminder for task #{task.id}: {e}")
         
-        for task in pending_tasks:
-            # Skip tasks without due dates
-            if not task.due_at:
-                continue
-            
-            # Check if deadline is within threshold and reminder not sent
-            if task.due_at <= reminder_threshold and not task.deadline_reminder_sent:
-                # Don't remind if deadline already passed
-                if task.due_at < now:
-                    continue
-                
-                try:
-                    await self.on_deadline_reminder(task)
-                    self.task_manager.mark_deadline_reminded(task.id)
-                    logger.info(f"Sent deadline reminder for task #{task.id}")
-                except Exception as e:
-                    logger.error(f"Error sending deadline reminder for task #{task.id}: {e}")
+        # One save for every reminder sent this tick
+        if sent_ids:
+            self.task_manager.mark_deadline_reminded_bulk(sent_ids)
     
     @property
     def is_running(self) -> bool:
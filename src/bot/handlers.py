@@ -18,6 +18,7 @@ from src.bot.security import authorized_only, get_user_info
 from src.gemini.cli_wrapper import GeminiCLI
 from src.utils.logger import logger
 from src.utils.conversation import conversation_history
+from src.utils.markdown import markdown_to_html
 from src.scraper import scrape_url
 
 # Initialize Gemini CLI wrapper
@@ -526,38 +527,35 @@ async def _process_text_message(user_message: str, update: Update, context: Cont
         except Exception as e:
             logger.error(f"Error in cron extraction: {e}")
     
-    # Check for natural language task requests
-    if _tasks_automation and _tasks_automation.is_task_message(user_message):
-        logger.info("Detected task-like message, attempting extraction...")
+    # Check for natural language task requests (non-task messages skip Gemini)
+    if _tasks_automation:
+        task_like = False
         
-        # Send typing action
-        await context.bot.send_chat_action(
-            chat_id=update.effective_chat.id, 
-            action='typing'
-        )
+        async def on_task_like() -> None:
+            nonlocal task_like
+            task_like = True
+            logger.info("Detected task-like message, attempting extraction...")
+            # Send typing action
+            await context.bot.send_chat_action(
+                chat_id=update.effective_chat.id, 
+                action='typing'
+            )
         
         try:
-            # Get the extraction prompt
-            extraction_prompt = _tasks_automation.get_extraction_prompt(user_message)
-            
             # Ask Gemini to extract task details (no MCP needed - pure text parsing)
             # This skips MCP server initialization for much faster response (~15s vs ~4min)
-            extraction_response = await gemini.send_message(extraction_prompt, use_mcp=False)
+            parsed_tasks = await _tasks_automation.extract_tasks(user_message, gemini, on_task_like)
             
             # Try to create the task
-            task_created = await _tasks_automation.create_task_from_parsed(
-                extraction_response, 
-                update
-            )
-            
-            if task_created:
+            if parsed_tasks and await _tasks_automation.create_task_from_parsed(parsed_tasks, update):
                 # Task was created, we're done
                 conversation_history.add_message('USER', user_message, user_info['id'])
                 conversation_history.add_message('ASSISTANT', f"[Task created from: {user_message}]")
                 return
             
             # If task extraction failed, fall through to normal chat
-            logger.info("Task extraction failed, falling back to normal chat")
+            if task_like:
+                logger.info("Task extraction failed, falling back to normal chat")
             
         except Exception as e:
             logger.error(f"Error in task extraction: {e}")
@@ -660,33 +658,6 @@ async def _process_text_message(user_message: str, update: Update, context: Cont
         )
 
 
-def _markdown_to_html(text: str) -> str:
-    """Convert standard Markdown to Telegram HTML.
-    
-    Converts common Markdown syntax to HTML for reliable Telegram rendering.
-    """
-    import re
-    
-    # Escape HTML special chars first (except for our conversions)
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    
-    # Convert **bold** to <b>bold</b>
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    
-    # Convert *italic* to <i>italic</i> (but not if it's a bullet point at start of line)
-    text = re.sub(r'(?<!^)(?<!\n)\*(.+?)\*', r'<i>\1</i>', text)
-    
-    # Convert `code` to <code>code</code>
-    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-    
-    # Convert [text](url) to <a href="url">text</a>
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
-    
-    return text
-
-
 async def send_long_message(update: Update, text: str, max_length: int = 4000) -> None:
     """Send a long message, splitting if necessary.
     
@@ -703,7 +674,7 @@ async def send_long_message(update: Update, text: str, max_length: int = 4000) -
         return
     
     # Convert standard Markdown to Telegram HTML
-    html_text = _markdown_to_html(text)
+    html_text = markdown_to_html(text)
     
     # If message is short enough, send directly
     if len(html_text) <= max_length:
@@ -5,13 +5,15 @@ handling subprocess management, streaming output, and error handling.
 """
 
 import asyncio
+import codecs
+import re
 import subprocess
 import json
 import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import sys
 sys.path.insert(0, str(__file__).replace('\\', '/').rsplit('/src/', 1)[0])
@@ -62,6 +64,9 @@ class GeminiCLI:
     # Gemini CLI command - prefer local project install, then npx fallback
     _GEMINI_LOCAL_CMD = Path("node_modules/.bin/gemini.cmd").resolve()
     
+    # ANSI escape sequences in CLI output
+    _ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+    
     # Singleton instance
     _instance: 'GeminiCLI' = None
     
@@ -279,26 +284,17 @@ class GeminiCLI:
             logger.error(f"Error checking Gemini CLI status: {e}")
             return False
     
-    async def send_message(self, message: str, context: str = "", use_mcp: bool = True) -> str:
-        """Send a message to Gemini CLI and get the response.
+    def _build_prompt(self, message: str, context: str, use_mcp: bool) -> str:
+        """Build the full prompt with persona, capabilities, security and context.
         
         Args:
             message: The message/prompt to send to Gemini CLI
             context: Optional conversation context to include
-            use_mcp: Whether to enable MCP servers (default True).
-                     Set to False for simple tasks like JSON extraction
-                     to avoid MCP initialization overhead (~4 min → ~15 sec).
+            use_mcp: Whether MCP servers are enabled for this request
             
         Returns:
-            The response from Gemini CLI
-            
-        Raises:
-            TimeoutError: If Gemini CLI takes too long to respond
-            RuntimeError: If there's an error communicating with Gemini CLI
+            The prompt text to pipe to Gemini CLI
         """
-        mcp_status = "with MCP" if use_mcp else "without MCP (fast mode)"
-        logger.debug(f"Sending message to Gemini CLI {mcp_status}: {message[:100]}...")
-        
         # Build persona section if available (only for MCP-enabled requests)
         persona_section = ""
         if self._persona and use_mcp:
@@ -339,6 +335,54 @@ class GeminiCLI:
         else:
             full_prompt = f"{persona_section}{capabilities_section}{security_prefix}{message}"
         
+        return full_prompt
+    
+    def _build_command(self, use_mcp: bool) -> list:
+        """Build the Gemini CLI argument list for a headless request.
+        
+        Args:
+            use_mcp: Whether to include the MCP server whitelist
+            
+        Returns:
+            Command and arguments for create_subprocess_exec
+        """
+        # Build command using -p/--prompt flag for non-interactive (headless) mode
+        # Note: Gemini CLI v0.29+ defaults to interactive mode; must use -p flag.
+        # We pass -p "" to trigger headless mode, and pipe the actual prompt via
+        # stdin to avoid Windows command-line length limits (~32K chars).
+        gemini_cmd_path = self._get_gemini_cmd().strip('"')
+        cmd_args = [gemini_cmd_path]
+        
+        if use_mcp:
+            # Include MCP server whitelist for security
+            for server in self.ALLOWED_MCP_SERVERS:
+                cmd_args.extend(['--allowed-mcp-server-names', server])
+        
+        cmd_args.extend(['--yolo', '-p', ''])
+        return cmd_args
+    
+    async def send_message(self, message: str, context: str = "", use_mcp: bool = True) -> str:
+        """Send a message to Gemini CLI and get the response.
+        
+        Args:
+            message: The message/prompt to send to Gemini CLI
+            context: Optional conversation context to include
+            use_mcp: Whether to enable MCP servers (default True).
+                     Set to False for simple tasks like JSON extraction
+                     to avoid MCP initialization overhead (~4 min → ~15 sec).
+            
+        Returns:
+            The response from Gemini CLI
+            
+        Raises:
+            TimeoutError: If Gemini CLI takes too long to respond
+            RuntimeError: If there's an error communicating with Gemini CLI
+        """
+        mcp_status = "with MCP" if use_mcp else "without MCP (fast mode)"
+        logger.debug(f"Sending message to Gemini CLI {mcp_status}: {message[:100]}...")
+        
+        full_prompt = self._build_prompt(message, context, use_mcp)
+        
         # Write prompt to a temp file to avoid shell escaping issues
         prompt_file = None
         try:
@@ -351,23 +395,10 @@ class GeminiCLI:
             secure_env = os.environ.copy()
             secure_env['GEMINI_MCP_ALLOWED_DIRS'] = self.ALLOWED_DIR
             
-            # Build command using -p/--prompt flag for non-interactive (headless) mode
-            # Note: Gemini CLI v0.29+ defaults to interactive mode; must use -p flag.
-            # We pass -p "" to trigger headless mode, and pipe the actual prompt via
-            # stdin to avoid Windows command-line length limits (~32K chars).
-            
-            # Build the argument list for subprocess
-            gemini_cmd_path = self._get_gemini_cmd().strip('"')
-            cmd_args = [gemini_cmd_path]
-            
-            if use_mcp:
-                # Include MCP server whitelist for security
-                for server in self.ALLOWED_MCP_SERVERS:
-                    cmd_args.extend(['--allowed-mcp-server-names', server])
-            
-            cmd_args.extend(['--yolo', '-p', ''])
+            # Build the argument list for subprocess (headless -p mode, prompt via stdin)
+            cmd_args = self._build_command(use_mcp)
             
-            logger.debug(f"Gemini command: {gemini_cmd_path} -p '' [stdin prompt len={len(full_prompt)}]")
+            logger.debug(f"Gemini command: {cmd_args[0]} -p '' [stdin prompt len={len(full_prompt)}]")
             
             process = await asyncio.create_subprocess_exec(
                 *cmd_args,
@@ -435,6 +466,110 @@ class GeminiCLI:
                 except:
                     pass
     
+    async def send_message_stream(
+        self,
+        message: str,
+        context: str = "",
+        use_mcp: bool = False
+    ) -> AsyncIterator[str]:
+        """Send a message to Gemini CLI and yield the response as it is generated.
+        
+        Same prompt and command as send_message(), but stdout is read
+        incrementally so callers can show partial output early.
+        
+        Args:
+            message: The message/prompt to send to Gemini CLI
+            context: Optional conversation context to include
+            use_mcp: Whether to enable MCP servers (default False)
+            
+        Yields:
+            Chunks of response text (ANSI/control characters removed)
+            
+        Raises:
+            TimeoutError: If Gemini CLI takes too long to respond
+            RuntimeError: If there's an error communicating with Gemini CLI
+        """
+        full_prompt = self._build_prompt(message, context, use_mcp)
+        
+        secure_env = os.environ.copy()
+        secure_env['GEMINI_MCP_ALLOWED_DIRS'] = self.ALLOWED_DIR
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._build_command(use_mcp),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.ALLOWED_DIR,
+                env=secure_env
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error calling Gemini CLI: {e}")
+            raise RuntimeError(f"Failed to communicate with Gemini CLI: {e}")
+        
+        self._active_processes.add(process)
+        # Drain stderr concurrently so a chatty CLI can't block on a full pipe
+        stderr_task = asyncio.create_task(process.stderr.read())
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        received = False
+        
+        # One deadline for the whole call; each read waits only for what is
+        # left of it, so no timeout scope is open while a chunk is yielded
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        
+        try:
+            try:
+                process.stdin.write(full_prompt.encode('utf-8'))
+                await asyncio.wait_for(process.stdin.drain(), max(0, deadline - loop.time()))
+                process.stdin.close()
+            except (BrokenPipeError, ConnectionResetError) as e:
+                raise RuntimeError(f"Failed to communicate with Gemini CLI: {e}")
+            
+            while True:
+                chunk = await asyncio.wait_for(
+                    process.stdout.read(4096), max(0, deadline - loop.time())
+                )
+                if not chunk:
+                    break
+                text = self._clean_chunk(decoder.decode(chunk))
+                if text:
+                    received = True
+                    yield text
+            
+            tail = self._clean_chunk(decoder.decode(b'', final=True))
+            if tail:
+                received = True
+                yield tail
+            
+            error_output = (
+                await asyncio.wait_for(stderr_task, max(0, deadline - loop.time()))
+            ).decode('utf-8', errors='replace').strip()
+            await asyncio.wait_for(process.wait(), max(0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Gemini CLI did not respond within {self.timeout} seconds"
+            )
+        finally:
+            if process.returncode is None:
+                try:
+                    process.terminate()
+                except Exception:
+                    pass
+            stderr_task.cancel()
+            self._active_processes.discard(process)
+        
+        if process.returncode != 0 and not received:
+            if error_output:
+                raise RuntimeError(f"Gemini CLI error: {error_output}")
+            raise RuntimeError(f"Gemini CLI exited with code {process.returncode}")
+        
+        if not received and error_output:
+            # Sometimes output goes to stderr (same fallback as send_message)
+            error_text = self._clean_output(error_output)
+            if error_text:
+                yield error_text
+    
     def _escape_message(self, message: str) -> str:
         """Escape a message for safe shell execution.
         
@@ -456,11 +591,8 @@ class GeminiCLI:
         Returns:
             Cleaned output string
         """
-        import re
-        
         # Remove ANSI escape codes
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        output = ansi_escape.sub('', output)
+        output = self._ANSI_ESCAPE_RE.sub('', output)
         
         # Remove other control characters (except newlines and tabs)
         output = ''.join(
@@ -470,6 +602,18 @@ class GeminiCLI:
         
         return output.strip()
     
+    def _clean_chunk(self, chunk: str) -> str:
+        """Remove ANSI codes and control characters from a partial output chunk.
+        
+        Unlike _clean_output(), surrounding whitespace is kept so chunks
+        can be concatenated.
+        """
+        chunk = self._ANSI_ESCAPE_RE.sub('', chunk)
+        return ''.join(
+            char for char in chunk
+            if char >= ' ' or char in '\n\t'
+        )
+    
     def cancel_current(self) -> None:
         """Cancel all active Gemini CLI processes."""
         if not self._active_processes:
@@ -7,9 +7,10 @@ Run this script to start the bot.
 import sys
 from pathlib import Path
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path for imports (once, for the whole process)
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 
@@ -5,7 +5,7 @@ This module handles saving and loading conversation history for context.
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import threading
 
 import sys
@@ -36,6 +36,12 @@ class ConversationHistory:
         self.summary_file = self.history_file.parent / "conversation_summary.txt"
         self._lock = threading.Lock()
         
+        # Bumped on every write; get_context_for_gemini() reuses its results,
+        # one per max_chars, while the version they were built at is current
+        self._version = 0
+        self._cached_contexts_version = 0
+        self._cached_contexts: Dict[Optional[int], str] = {}
+        
         # Ensure directories and files exist
         self.ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
         if not self.history_file.exists():
@@ -69,6 +75,7 @@ class ConversationHistory:
             try:
                 with open(self.history_file, 'a', encoding='utf-8') as f:
                     f.write(entry)
+                self._version += 1
                 logger.debug(f"Saved {role} message to history")
             except Exception as e:
                 logger.error(f"Failed to save message to history: {e}")
@@ -141,6 +148,38 @@ class ConversationHistory:
             logger.error(f"Failed to read full history: {e}")
             return ""
     
+    def get_history_tail(self, max_chars: int) -> str:
+        """Get roughly the last max_chars characters of the history.
+        
+        Only the end of the file is read (in binary mode, decoded once),
+        and the result starts at a message boundary where possible.
+        
+        Args:
+            max_chars: Maximum number of characters to return
+            
+        Returns:
+            The tail of the conversation history
+        """
+        if max_chars <= 0:
+            return ""
+        try:
+            with open(self.history_file, 'rb') as f:
+                size = f.seek(0, 2)
+                # UTF-8 uses at most 4 bytes per character
+                f.seek(max(0, size - max_chars * 4))
+                tail = f.read().decode('utf-8', errors='ignore')
+        except Exception as e:
+            logger.error(f"Failed to read history tail: {e}")
+            return ""
+        
+        if len(tail) <= max_chars:
+            return tail
+        tail = tail[-max_chars:]
+        
+        # Drop the partial message at the start of the slice
+        boundary = tail.find('\n\n[')
+        return tail[boundary + 2:] if boundary != -1 else tail
+    
     def get_summary(self) -> str:
         """Get the saved conversation summary.
         
@@ -224,6 +263,7 @@ class ConversationHistory:
                     f"# Previous history summarized on: {timestamp}\n"
                     f"# See: conversation_summary.txt for context\n\n"
                 )
+                self._version += 1
                 
             logger.info(f"Saved conversation summary and archived history")
             return True
@@ -232,19 +272,40 @@ class ConversationHistory:
             logger.error(f"Failed to save summary: {e}")
             return False
     
-    def get_context_for_gemini(self) -> str:
+    def get_context_for_gemini(self, max_chars: Optional[int] = None) -> str:
         """Get the complete context for Gemini (summary + recent history).
         
+        Args:
+            max_chars: Optional cap on the history part. When set, only the
+                most recent max_chars characters of history are read.
+        
         Returns:
             Combined context string optimized for Gemini
         """
+        version = self._version
+        if self._cached_contexts_version != version:
+            self._cached_contexts = {}
+            self._cached_contexts_version = version
+        # Kept locally: if a write replaces the dict meanwhile, this result
+        # lands in the discarded one instead of the new version's
+        contexts = self._cached_contexts
+        cached = contexts.get(max_chars)
+        if cached is not None:
+            return cached
+        
         summary = self.get_summary()
-        history = self.get_full_history()
+        if max_chars is None:
+            history = self.get_full_history()
+        else:
+            history = self.get_history_tail(max_chars)
         
         if summary:
-            return f"=== PREVIOUS CONVERSATION SUMMARY ===\n{summary}\n\n=== RECENT CONVERSATION ===\n{history}"
+            context = f"=== PREVIOUS CONVERSATION SUMMARY ===\n{summary}\n\n=== RECENT CONVERSATION ===\n{history}"
         else:
-            return history
+            context = history
+        
+        contexts[max_chars] = context
+        return context
     
     def clear_history(self) -> bool:
         """Clear the conversation history (archives first).
@@ -262,6 +323,7 @@ class ConversationHistory:
                     "# Format: [TIMESTAMP] USER/ASSISTANT: message\n"
                     f"# Cleared on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
                 )
+                self._version += 1
             logger.info("Conversation history cleared (archived first)")
             return True
         except Exception as e:
@@ -279,6 +341,7 @@ class ConversationHistory:
             self.clear_history()
             if self.summary_file.exists():
                 self.summary_file.unlink()
+            self._version += 1
             logger.info("Cleared all conversation data (history + summary)")
             return True
         except Exception as e:
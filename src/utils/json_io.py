@@ -0,0 +1,65 @@
+"""JSON encoding/decoding helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module,
+so callers get the fast C encoder without a hard dependency on it.
+Dataclass instances are encoded as objects on both paths.
+"""
+
+import dataclasses
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from bytes or str.
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Option presets, built once and reused for every write
+if orjson is not None:
+    _OPT_PRETTY = orjson.OPT_INDENT_2
+    _OPT_SORTED = orjson.OPT_SORT_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """stdlib json fallback hook: encode dataclasses like orjson does."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with a 2-space indent
+        sort_keys: Sort object keys (stable, diff-friendly output)
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        option = (_OPT_PRETTY if indent else 0) | (_OPT_SORTED if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        default=_default
+    ).encode('utf-8')
@@ -0,0 +1,28 @@
+"""Markdown to Telegram HTML conversion."""
+
+import re
+
+
+def markdown_to_html(text: str) -> str:
+    """Convert standard Markdown to Telegram HTML.
+    
+    Converts common Markdown syntax to HTML for reliable Telegram rendering.
+    """
+    # Escape HTML special chars first (except for our conversions)
+    text = text.replace('&', '&amp;')
+    text = text.replace('<', '&lt;')
+    text = text.replace('>', '&gt;')
+    
+    # Convert **bold** to <b>bold</b>
+    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
+    
+    # Convert *italic* to <i>italic</i> (but not if it's a bullet point at start of line)
+    text = re.sub(r'(?<!^)(?<!\n)\*(.+?)\*', r'<i>\1</i>', text)
+    
+    # Convert `code` to <code>code</code>
+    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    
+    # Convert [text](url) to <a href="url">text</a>
+    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
+    
+    return text